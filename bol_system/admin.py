@@ -55,6 +55,9 @@ class ProductAdmin(TenantAdminMixin, admin.ModelAdmin):
     list_filter = ['is_active', 'created_at']
     search_fields = ['name']
     readonly_fields = ['shipped_tons_display', 'remaining_tons_display']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_tonnage()
     
     def shipped_tons_display(self, obj):
         return f"{obj.shipped_tons:.2f}"
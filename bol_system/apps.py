@@ -1,6 +1,31 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class BolSystemConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'bol_system'
\ No newline at end of file
+    name = 'bol_system'
+
+    def ready(self):
+        from .models import CompanyBranding, ReleaseLoad, RoleRedirectConfig, Tenant
+        from .signals import (
+            clear_branding_cache,
+            clear_role_redirect_cache,
+            clear_tenant_cache,
+            update_release_counters_on_load_delete,
+            update_release_counters_on_load_save,
+        )
+
+        # CompanyBranding.save() clears its own cache; deletes go through the signal
+        post_delete.connect(clear_branding_cache, sender=CompanyBranding,
+                            dispatch_uid='clear_branding_cache')
+        for signal in (post_save, post_delete):
+            signal.connect(clear_role_redirect_cache, sender=RoleRedirectConfig,
+                           dispatch_uid='clear_role_redirect_cache')
+            signal.connect(clear_tenant_cache, sender=Tenant,
+                           dispatch_uid='clear_tenant_cache')
+
+        post_save.connect(update_release_counters_on_load_save, sender=ReleaseLoad,
+                          dispatch_uid='update_release_counters_on_load_save')
+        post_delete.connect(update_release_counters_on_load_delete, sender=ReleaseLoad,
+                            dispatch_uid='update_release_counters_on_load_delete')
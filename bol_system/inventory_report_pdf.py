@@ -13,6 +13,83 @@ from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_CENTER
 from datetime import datetime
 
 
+# Styles are identical for every report; build them once per process
+_STYLES = getSampleStyleSheet()
+
+_HEADER_STYLE = ParagraphStyle(
+    'CustomHeader',
+    parent=_STYLES['Heading1'],
+    fontSize=20,
+    textColor=colors.HexColor('#000000'),
+    spaceAfter=0,
+    spaceBefore=0,
+    fontName='Helvetica-Bold'
+)
+
+_SUBHEADER_STYLE = ParagraphStyle(
+    'CustomSubheader',
+    parent=_STYLES['Normal'],
+    fontSize=8,
+    textColor=colors.HexColor('#666666'),
+    spaceAfter=0,
+    spaceBefore=0
+)
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=14,
+    textColor=colors.HexColor('#000000'),
+    spaceAfter=2,
+    spaceBefore=4,
+    fontName='Helvetica-Bold'
+)
+
+_DATE_STYLE = ParagraphStyle(
+    'DateStyle',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    alignment=TA_RIGHT,
+    textColor=colors.HexColor('#666666'),
+    spaceAfter=0,
+    spaceBefore=0
+)
+
+_SECTION_TITLE_STYLE = ParagraphStyle(
+    'SectionTitle',
+    parent=_STYLES['Heading2'],
+    fontSize=10,
+    textColor=colors.HexColor('#000000'),
+    spaceAfter=3,
+    spaceBefore=6,
+    fontName='Helvetica-Bold'
+)
+
+_SMALL_STYLE = ParagraphStyle(
+    'SmallText',
+    parent=_STYLES['Normal'],
+    fontSize=8,
+    spaceAfter=0,
+    spaceBefore=0
+)
+
+_LEGEND_STYLE = ParagraphStyle(
+    'Legend',
+    parent=_STYLES['Normal'],
+    fontSize=7,
+    textColor=colors.HexColor('#888888'),
+)
+
+_FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_STYLES['Normal'],
+    fontSize=7,
+    textColor=colors.HexColor('#888888'),
+    alignment=TA_CENTER,
+    spaceBefore=2
+)
+
+
 def generate_eom_inventory_pdf(report_data):
     """
     Generate branded PDF for EOM inventory report.
@@ -42,74 +119,15 @@ def generate_eom_inventory_pdf(report_data):
     )
 
     story = []
-    styles = getSampleStyleSheet()
-
-    # Compact custom styles
-    header_style = ParagraphStyle(
-        'CustomHeader',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor('#000000'),
-        spaceAfter=0,
-        spaceBefore=0,
-        fontName='Helvetica-Bold'
-    )
-
-    subheader_style = ParagraphStyle(
-        'CustomSubheader',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor('#666666'),
-        spaceAfter=0,
-        spaceBefore=0
-    )
-
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=14,
-        textColor=colors.HexColor('#000000'),
-        spaceAfter=2,
-        spaceBefore=4,
-        fontName='Helvetica-Bold'
-    )
-
-    date_style = ParagraphStyle(
-        'DateStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        alignment=TA_RIGHT,
-        textColor=colors.HexColor('#666666'),
-        spaceAfter=0,
-        spaceBefore=0
-    )
-
-    section_title_style = ParagraphStyle(
-        'SectionTitle',
-        parent=styles['Heading2'],
-        fontSize=10,
-        textColor=colors.HexColor('#000000'),
-        spaceAfter=3,
-        spaceBefore=6,
-        fontName='Helvetica-Bold'
-    )
-
-    small_style = ParagraphStyle(
-        'SmallText',
-        parent=styles['Normal'],
-        fontSize=8,
-        spaceAfter=0,
-        spaceBefore=0
-    )
 
     # Compact header - all on fewer lines
     header_table_data = [
         [
-            Paragraph("CBRT", header_style),
-            Paragraph("INVENTORY REPORT", title_style)
+            Paragraph("CBRT", _HEADER_STYLE),
+            Paragraph("INVENTORY REPORT", _TITLE_STYLE)
         ],
         [
-            Paragraph("Cincinnati Barge & Rail Terminal, LLC<br/>1707 Riverside Drive, Cincinnati, Ohio 45202", subheader_style),
+            Paragraph("Cincinnati Barge & Rail Terminal, LLC<br/>1707 Riverside Drive, Cincinnati, Ohio 45202", _SUBHEADER_STYLE),
             ''
         ]
     ]
@@ -157,8 +175,8 @@ def generate_eom_inventory_pdf(report_data):
     # Prepared for + dates in compact two-column layout
     info_table_data = [
         [
-            Paragraph("<b>PREPARED FOR:</b> Primetrade, LLC, 11440 Carmel Commons Blvd, Suite 200, Charlotte, NC 28226", small_style),
-            Paragraph(f"{date_range}<br/>Generated: {generated_str}", date_style)
+            Paragraph("<b>PREPARED FOR:</b> Primetrade, LLC, 11440 Carmel Commons Blvd, Suite 200, Charlotte, NC 28226", _SMALL_STYLE),
+            Paragraph(f"{date_range}<br/>Generated: {generated_str}", _DATE_STYLE)
         ]
     ]
     info_table = Table(info_table_data, colWidths=[5.0 * inch, 2.7 * inch])
@@ -174,7 +192,7 @@ def generate_eom_inventory_pdf(report_data):
     story.append(Spacer(1, 0.1 * inch))
 
     # Inventory summary section
-    story.append(Paragraph("INVENTORY SUMMARY", section_title_style))
+    story.append(Paragraph("INVENTORY SUMMARY", _SECTION_TITLE_STYLE))
 
     products = report_data.get('products', [])
     totals = report_data.get('totals', {})
@@ -182,10 +200,10 @@ def generate_eom_inventory_pdf(report_data):
     # Build compact summary table
     summary_data = [
         [
-            Paragraph("<b>Product</b>", small_style),
-            Paragraph("<b>Beginning</b>", small_style),
-            Paragraph("<b>Shipped</b>", small_style),
-            Paragraph("<b>Ending</b>", small_style),
+            Paragraph("<b>Product</b>", _SMALL_STYLE),
+            Paragraph("<b>Beginning</b>", _SMALL_STYLE),
+            Paragraph("<b>Shipped</b>", _SMALL_STYLE),
+            Paragraph("<b>Ending</b>", _SMALL_STYLE),
         ]
     ]
 
@@ -199,10 +217,10 @@ def generate_eom_inventory_pdf(report_data):
 
     # Totals row
     summary_data.append([
-        Paragraph("<b>TOTALS</b>", small_style),
-        Paragraph(f"<b>{_format_tons(totals.get('beginning_inventory', 0))}</b>", small_style),
-        Paragraph(f"<b>{_format_tons(totals.get('shipped_this_period', 0))}</b>", small_style),
-        Paragraph(f"<b>{_format_tons(totals.get('ending_inventory', 0))}</b>", small_style),
+        Paragraph("<b>TOTALS</b>", _SMALL_STYLE),
+        Paragraph(f"<b>{_format_tons(totals.get('beginning_inventory', 0))}</b>", _SMALL_STYLE),
+        Paragraph(f"<b>{_format_tons(totals.get('shipped_this_period', 0))}</b>", _SMALL_STYLE),
+        Paragraph(f"<b>{_format_tons(totals.get('ending_inventory', 0))}</b>", _SMALL_STYLE),
     ])
 
     summary_table = Table(summary_data, colWidths=[3.2 * inch, 1.5 * inch, 1.5 * inch, 1.5 * inch])
@@ -230,15 +248,15 @@ def generate_eom_inventory_pdf(report_data):
 
         # Keep section title and table together
         section_elements = []
-        section_elements.append(Paragraph(f"SHIPMENTS: {product.get('name', '')}", section_title_style))
+        section_elements.append(Paragraph(f"SHIPMENTS: {product.get('name', '')}", _SECTION_TITLE_STYLE))
 
         detail_data = [
             [
-                Paragraph("<b>BOL #</b>", small_style),
-                Paragraph("<b>Date</b>", small_style),
-                Paragraph("<b>Customer</b>", small_style),
-                Paragraph("<b>Release</b>", small_style),
-                Paragraph("<b>Weight</b>", small_style),
+                Paragraph("<b>BOL #</b>", _SMALL_STYLE),
+                Paragraph("<b>Date</b>", _SMALL_STYLE),
+                Paragraph("<b>Customer</b>", _SMALL_STYLE),
+                Paragraph("<b>Release</b>", _SMALL_STYLE),
+                Paragraph("<b>Weight</b>", _SMALL_STYLE),
             ]
         ]
 
@@ -275,28 +293,14 @@ def generate_eom_inventory_pdf(report_data):
     # Compact footer
     story.append(Spacer(1, 0.05 * inch))
 
-    legend_style = ParagraphStyle(
-        'Legend',
-        parent=styles['Normal'],
-        fontSize=7,
-        textColor=colors.HexColor('#888888'),
-    )
-    story.append(Paragraph("All weights are Bucket weights (net tons)", legend_style))
+    story.append(Paragraph("All weights are Bucket weights (net tons)", _LEGEND_STYLE))
 
     story.append(Spacer(1, 0.05 * inch))
     story.append(line_table)
 
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=7,
-        textColor=colors.HexColor('#888888'),
-        alignment=TA_CENTER,
-        spaceBefore=2
-    )
     story.append(Paragraph(
         "This document certifies inventory movements for the period shown. Contact Cincinnati Barge & Rail Terminal, LLC for questions.",
-        footer_style
+        _FOOTER_STYLE
     ))
 
     # Build PDF
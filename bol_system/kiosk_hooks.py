@@ -12,7 +12,7 @@ from .pdf_generator import generate_bol_pdf
 def search_bols(query: str, filters: dict = None, request=None) -> list[dict]:
     """Search BOLs for office assignment."""
     # TODO: Add tenant filtering for multi-tenant
-    qs = BOL.objects.filter(bol_status='ready')
+    qs = BOL.list_values('customer__customer').filter(bol_status='ready')
 
     if query:
         qs = qs.filter(
@@ -33,13 +33,13 @@ def search_bols(query: str, filters: dict = None, request=None) -> list[dict]:
     results = []
     for bol in qs[:20]:
         results.append({
-            'id': bol.id,
-            'bol_number': bol.bol_number,
-            'customer_name': bol.customer.customer if bol.customer else bol.buyer_name or '',
-            'truck_number': bol.truck_number or '',
-            'status': bol.bol_status,
-            'created_at': bol.created_at.isoformat() if bol.created_at else '',
-            'summary': f"{bol.product_name or 'Pig Iron'}, {bol.net_tons or 0:,.2f} tons",
+            'id': bol['id'],
+            'bol_number': bol['bol_number'],
+            'customer_name': bol['customer__customer'] or bol['buyer_name'] or '',
+            'truck_number': bol['truck_number'] or '',
+            'status': bol['bol_status'],
+            'created_at': bol['created_at'].isoformat() if bol['created_at'] else '',
+            'summary': f"{bol['product_name'] or 'Pig Iron'}, {bol['net_tons'] or 0:,.2f} tons",
         })
 
     return results
@@ -25,7 +25,7 @@ class Command(BaseCommand):
 
             if key:
                 bol.pdf_key = key
-                bol.save(update_fields=['pdf_key'])
+                bol.save(update_fields=['pdf_key', 'updated_at'])
                 updated += 1
                 self.stdout.write(f"Updated BOL {bol.bol_number}: {bol.pdf_key}")
             else:
@@ -148,7 +148,7 @@ class Command(BaseCommand):
 
                     # Update BOL record with new URL
                     bol.pdf_url = s3_url
-                    bol.save(update_fields=['pdf_url'])
+                    bol.save(update_fields=['pdf_url', 'updated_at'])
 
                     self.stdout.write(self.style.SUCCESS(
                         f'  ✓ {bol.bol_number}: Uploaded to S3'
@@ -3,27 +3,36 @@ Management command to regenerate a BOL PDF and upload it to S3.
 
 Usage:
     python manage.py regenerate_bol_pdf PRT-2025-0005
+    python manage.py regenerate_bol_pdf PRT-2025-0005 PRT-2025-0006 --workers 4
 
 This regenerates the PDF from the BOL data in the database and uploads it to S3.
+Several BOL numbers are rendered in parallel across worker processes.
 """
 
 from django.core.management.base import BaseCommand
 from bol_system.models import BOL
-from bol_system.pdf_generator import generate_bol_pdf
+from bol_system.pdf_generator import delete_superseded_pdf, generate_bol_pdf, generate_bols_bulk
+from bol_system.views import _derive_pdf_key
 
 
 class Command(BaseCommand):
     help = 'Regenerate a BOL PDF and upload it to S3'
 
     def add_arguments(self, parser):
-        parser.add_argument('bol_number', type=str, help='BOL number (e.g., PRT-2025-0005)')
+        parser.add_argument('bol_numbers', nargs='+', type=str, help='BOL number(s) (e.g., PRT-2025-0005)')
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Worker processes for multi-BOL regeneration (default: CPU count; 1 = serial)')
 
     def handle(self, *args, **options):
-        bol_number = options['bol_number']
+        bol_numbers = options['bol_numbers']
+        if len(bol_numbers) > 1:
+            return self._regenerate_many(bol_numbers, options['workers'])
+
+        bol_number = bol_numbers[0]
 
         # Validate BOL exists
         try:
-            bol = BOL.objects.get(bol_number=bol_number)
+            bol = BOL.objects.for_pdf().get(bol_number=bol_number)
         except BOL.DoesNotExist:
             self.stdout.write(self.style.ERROR(f'❌ BOL not found: {bol_number}'))
             return
@@ -35,11 +44,14 @@ class Command(BaseCommand):
 
         try:
             # Generate PDF (will upload to S3 if USE_S3=True)
-            new_url = generate_bol_pdf(bol)
+            new_url = generate_bol_pdf(bol, force=True)
 
             # Update database
+            old_url = bol.pdf_url
             bol.pdf_url = new_url
-            bol.save()
+            bol.pdf_key = _derive_pdf_key(new_url)
+            bol.save(update_fields=['pdf_url', 'pdf_key', 'updated_at'])
+            delete_superseded_pdf(old_url, new_url)
 
             self.stdout.write(self.style.SUCCESS(f'\n✅ Success!'))
             self.stdout.write(f'   New URL: {new_url[:100]}...')
@@ -54,3 +66,23 @@ class Command(BaseCommand):
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'\n❌ Error: {str(e)}'))
             raise
+
+    def _regenerate_many(self, bol_numbers, workers):
+        bols = {bol.id: bol for bol in BOL.objects.filter(bol_number__in=bol_numbers)}
+        missing = set(bol_numbers) - {bol.bol_number for bol in bols.values()}
+        for bol_number in sorted(missing):
+            self.stdout.write(self.style.ERROR(f'❌ BOL not found: {bol_number}'))
+
+        self.stdout.write(f'\n📄 Regenerating {len(bols)} PDFs...')
+        urls = generate_bols_bulk(bols.keys(), max_workers=workers, force=True)
+
+        for bol_id, new_url in urls.items():
+            bol = bols[bol_id]
+            old_url = bol.pdf_url
+            bol.pdf_url = new_url
+            bol.pdf_key = _derive_pdf_key(new_url)
+            bol.save(update_fields=['pdf_url', 'pdf_key', 'updated_at'])
+            delete_superseded_pdf(old_url, new_url)
+            self.stdout.write(f'   {bol.bol_number}: {new_url[:100]}')
+
+        self.stdout.write(self.style.SUCCESS(f'\n✅ Regenerated {len(urls)} BOL PDFs'))
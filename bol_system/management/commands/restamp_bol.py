@@ -38,7 +38,7 @@ class Command(BaseCommand):
         url = watermark_bol_pdf(bol)
         if url:
             bol.stamped_pdf_url = url
-            bol.save(update_fields=['stamped_pdf_url'])
+            bol.save(update_fields=['stamped_pdf_url', 'updated_at'])
             self.stdout.write(self.style.SUCCESS(f'Done! New stamped PDF: {url}'))
         else:
             self.stderr.write(self.style.ERROR('Failed to generate stamped PDF'))
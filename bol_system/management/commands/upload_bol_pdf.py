@@ -61,7 +61,7 @@ class Command(BaseCommand):
 
             # Update database
             bol.pdf_url = s3_url
-            bol.save()
+            bol.save(update_fields=['pdf_url', 'updated_at'])
 
             self.stdout.write(self.style.SUCCESS(f'\n✅ Success!'))
             self.stdout.write(f'   Uploaded: {saved_path}')
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-16 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bol_system', '0032_rename_tenant_to_primetrade'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bol',
+            index=models.Index(fields=['product', '-created_at'], name='bol_system__product_4dd689_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bol',
+            index=models.Index(fields=['customer', '-created_at'], name='bol_system__custome_2d0206_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='releaseload',
+            index=models.Index(fields=['release', 'status'], name='rl_release_status_idx'),
+        ),
+    ]
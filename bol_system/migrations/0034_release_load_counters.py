@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-16 23:16
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_load_counters(apps, schema_editor):
+    """
+    Populate the denormalized load counters from existing ReleaseLoad rows.
+    """
+    Release = apps.get_model('bol_system', 'Release')
+    ReleaseLoad = apps.get_model('bol_system', 'ReleaseLoad')
+
+    loads = ReleaseLoad.objects.filter(release=OuterRef('pk')).order_by().values('release')
+    Release.objects.update(
+        total_loads_cached=Coalesce(Subquery(loads.annotate(n=Count('id')).values('n')), 0),
+        loads_shipped_cached=Coalesce(
+            Subquery(loads.filter(status='SHIPPED').annotate(n=Count('id')).values('n')), 0
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bol_system', '0033_add_load_and_bol_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='release',
+            name='loads_shipped_cached',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='release',
+            name='total_loads_cached',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_load_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-16 23:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bol_system', '0034_release_load_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='carrier',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['carrier_name'], name='carrier_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['customer'], name='customer_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customershipto',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['customer', 'name'], name='shipto_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['name'], name='product_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='truck',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['carrier', 'truck_number'], name='truck_active_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-16 23:40
+
+from datetime import datetime
+
+from django.db import migrations
+
+
+def backfill_bol_date(apps, schema_editor):
+    """
+    Populate BOL.bol_date from the legacy string date for older BOLs.
+    """
+    BOL = apps.get_model('bol_system', 'BOL')
+
+    to_update = []
+    for bol in BOL.objects.filter(bol_date__isnull=True).exclude(date='').only('id', 'date'):
+        for fmt in ('%Y-%m-%d', '%m/%d/%Y', '%m/%d/%y'):
+            try:
+                bol.bol_date = datetime.strptime(bol.date.strip(), fmt).date()
+            except ValueError:
+                continue
+            to_update.append(bol)
+            break
+    BOL.objects.bulk_update(to_update, ['bol_date'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bol_system', '0035_add_active_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_bol_date, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,39 @@
-from django.db import models, transaction
+from django.db import IntegrityError, close_old_connections, models, transaction
+from django.utils import timezone
 from django.core.validators import RegexValidator
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, OuterRef, Prefetch, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+import atexit
 import logging
+import queue
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Per-process config caches are dropped on save/delete (see apps.py) and also
+# expire after this many seconds so edits made in another worker propagate.
+CONFIG_CACHE_TTL_SECONDS = 300
+
+# Tenant lookups gate every tenant-scoped request, so a deactivation made in
+# another worker must take effect quickly
+TENANT_CACHE_TTL_SECONDS = 60
+
+# ReleaseLoad._loaded_status when the status column was deferred at load time
+STATUS_NOT_LOADED = object()
+
+# Background PDF renders/stamps share one bounded pool per process, so a
+# burst of BOL creates cannot start unbounded renders next to request threads
+PDF_RENDER_WORKERS = 2
+
+# Buffered AuditLog writes (see AuditLog.enqueue)
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.5
+AUDIT_QUEUE_MAX_SIZE = 10000
+
 
 class Tenant(models.Model):
     """
@@ -24,6 +53,21 @@ class Tenant(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def get_active_by_code(cls, code):
+        """
+        Return the active tenant with this code (case-insensitive), or None.
+
+        Every tenant-scoped API call resolves its tenant first, so results
+        come from the per-process config cache (cleared on Tenant
+        save/delete, see apps.py, and expired after TENANT_CACHE_TTL_SECONDS).
+        Misses are not cached, so a new or reactivated tenant is found at once.
+        """
+        try:
+            return _active_tenant(code.upper(), _config_ttl_bucket(TENANT_CACHE_TTL_SECONDS))
+        except cls.DoesNotExist:
+            return None
+
 
 class TimestampedModel(models.Model):
     """Base model with common timestamp fields"""
@@ -34,6 +78,27 @@ class TimestampedModel(models.Model):
     class Meta:
         abstract = True
 
+class ProductQuerySet(models.QuerySet):
+    def with_tonnage(self):
+        """Annotate shipped tons (non-voided BOL net_tons) in the same query."""
+        return self.annotate(
+            _shipped_tons=Coalesce(
+                Sum('bol__net_tons', filter=Q(bol__is_void=False)),
+                Decimal('0'),
+                output_field=models.DecimalField(max_digits=10, decimal_places=2),
+            )
+        )
+
+    def tonnage_values(self, *fields):
+        """
+        Plain dict rows with ``shipped_tons`` from with_tonnage().
+
+        Skips model instantiation for list endpoints; callers derive
+        remaining tons from start_tons - shipped_tons.
+        """
+        return self.with_tonnage().values(*fields, shipped_tons=F('_shipped_tons'))
+
+
 class Product(TimestampedModel):
     tenant = models.ForeignKey(
         Tenant, on_delete=models.CASCADE, null=True,
@@ -50,8 +115,13 @@ class Product(TimestampedModel):
     p = models.DecimalField(max_digits=6, decimal_places=3, null=True, blank=True)
     mn = models.DecimalField(max_digits=6, decimal_places=3, null=True, blank=True)
 
+    objects = ProductQuerySet.as_manager()
+
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['name'], name='product_active_idx', condition=Q(is_active=True)),
+        ]
     
     def __str__(self):
         return self.name
@@ -59,6 +129,9 @@ class Product(TimestampedModel):
     @property
     def shipped_tons(self):
         """Calculate shipped tons using net_tons (bucket weight) from non-voided BOLs"""
+        shipped = getattr(self, '_shipped_tons', None)
+        if shipped is not None:
+            return shipped
         return self.bol_set.filter(is_void=False).aggregate(
             total=models.Sum('net_tons')
         )['total'] or 0
@@ -89,6 +162,9 @@ class Customer(TimestampedModel):
 
     class Meta:
         ordering = ['customer']
+        indexes = [
+            models.Index(fields=['customer'], name='customer_active_idx', condition=Q(is_active=True)),
+        ]
 
     def __str__(self):
         return self.customer
@@ -118,6 +194,9 @@ class CustomerShipTo(TimestampedModel):
     class Meta:
         ordering = ['customer','name']
         unique_together = [['customer','street','city','state','zip']]
+        indexes = [
+            models.Index(fields=['customer', 'name'], name='shipto_active_idx', condition=Q(is_active=True)),
+        ]
 
     def __str__(self):
         return f"{self.customer.customer} -> {self.street}, {self.city}" 
@@ -135,6 +214,9 @@ class Carrier(TimestampedModel):
     
     class Meta:
         ordering = ['carrier_name']
+        indexes = [
+            models.Index(fields=['carrier_name'], name='carrier_active_idx', condition=Q(is_active=True)),
+        ]
     
     def __str__(self):
         return self.carrier_name
@@ -148,6 +230,9 @@ class Truck(TimestampedModel):
     class Meta:
         ordering = ['truck_number']
         unique_together = [['carrier', 'truck_number']]
+        indexes = [
+            models.Index(fields=['carrier', 'truck_number'], name='truck_active_idx', condition=Q(is_active=True)),
+        ]
     
     def __str__(self):
         return f"{self.truck_number} / {self.trailer_number}"
@@ -181,7 +266,9 @@ class BOLCounter(models.Model):
         """
         Atomically get next BOL number.
 
-        Uses select_for_update to prevent race conditions.
+        Increments the counter with a single UPDATE ... SET sequence = sequence + 1,
+        so concurrent callers only contend on the row write itself instead of
+        a SELECT FOR UPDATE followed by a separate save.
 
         Args:
             tenant: Tenant instance (optional for backward compat)
@@ -190,18 +277,38 @@ class BOLCounter(models.Model):
         Returns:
             String like "PRT-2025-0001"
         """
-        from django.utils import timezone
         current_year = timezone.now().year
 
         with transaction.atomic():
-            counter, created = cls.objects.select_for_update().get_or_create(
-                tenant=tenant,
-                year=current_year,
-                defaults={'sequence': 0}
+            counters = cls.objects.filter(tenant=tenant, year=current_year)
+            if not counters.update(sequence=F('sequence') + 1):
+                # First BOL of the year for this tenant
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(tenant=tenant, year=current_year, sequence=1)
+                    return f"{prefix}-{current_year}-{1:04d}"
+                except IntegrityError:
+                    # Another request created the row first
+                    counters.update(sequence=F('sequence') + 1)
+            sequence = counters.values_list('sequence', flat=True).get()
+            return f"{prefix}-{current_year}-{sequence:04d}"
+
+
+class BOLManager(models.Manager):
+    """Default BOL manager; joins the FKs that BOL.save and the PDF/detail paths read."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('product', 'carrier', 'customer', 'truck')
+
+    def for_pdf(self):
+        """BOLs with PDF inputs joined and total pounds computed in SQL (short tons: 2000 lbs/ton)."""
+        return self.get_queryset().select_related('lot_ref', 'release_line__release').annotate(
+            _total_lbs=ExpressionWrapper(
+                F('net_tons') * Decimal('2000'),
+                output_field=DecimalField(max_digits=14, decimal_places=2),
             )
-            counter.sequence += 1
-            counter.save()
-            return f"{prefix}-{current_year}-{counter.sequence:04d}"
+        )
+
 
 class BOL(TimestampedModel):
     """
@@ -307,6 +414,8 @@ class BOL(TimestampedModel):
         help_text='Kiosk workflow status'
     )
 
+    objects = BOLManager()
+
     class Meta:
         ordering = ['-created_at']
         unique_together = [['tenant', 'bol_number']]
@@ -321,33 +430,89 @@ class BOL(TimestampedModel):
         indexes = [
             models.Index(fields=['tenant', 'bol_date']),
             models.Index(fields=['tenant', 'is_void']),
+            models.Index(fields=['product', '-created_at']),
+            models.Index(fields=['customer', '-created_at']),
         ]
     
     def save(self, *args, **kwargs):
-        if not self.bol_number:
+        # Partial saves (update_fields) only default the fields they write
+        update_fields = kwargs.get('update_fields')
+
+        def writes(field):
+            return update_fields is None or field in update_fields
+
+        if writes('bol_number') and not self.bol_number:
             self.bol_number = BOLCounter.get_next_bol_number()
-        if self.product and not self.product_name:
-            self.product_name = self.product.name
-        if self.carrier and not self.carrier_name:
-            self.carrier_name = self.carrier.carrier_name
+        # Fetch just the missing name column rather than the related rows
+        if writes('product_name') and self.product_id and not self.product_name:
+            self.product_name = Product.objects.filter(pk=self.product_id).values_list('name', flat=True).first() or ''
+        if writes('carrier_name') and self.carrier_id and not self.carrier_name:
+            self.carrier_name = Carrier.objects.filter(pk=self.carrier_id).values_list('carrier_name', flat=True).first() or ''
+        if writes('bol_date') and self.bol_date is None and self.date:
+            # Keep the native date in step with the legacy string field
+            try:
+                self.bol_date = datetime.fromisoformat(self.date).date()
+            except (TypeError, ValueError):
+                pass
         logger.info(f"BOL {self.bol_number} saved with {self.net_tons} tons")
         super().save(*args, **kwargs)
     
     def delete(self, *args, **kwargs):
         """Override delete to revert linked ReleaseLoad to PENDING status."""
-        # Get related release loads before deletion
+        # Revert linked loads to PENDING in a single UPDATE
         release_loads = ReleaseLoad.objects.filter(bol=self)
-
-        # Revert each load to PENDING
-        for load in release_loads:
-            load.status = 'PENDING'
-            load.bol = None
-            load.save(update_fields=['status', 'bol', 'updated_at'])
-            logger.info(f"Reverted ReleaseLoad {load.id} to PENDING (BOL {self.bol_number} deleted)")
+        linked = list(release_loads.values_list('id', 'release_id'))
+        if linked:
+            release_loads.update(status='PENDING', bol=None, updated_at=timezone.now())
+            Release.refresh_load_counters({release_id for _, release_id in linked})
+            logger.info(f"Reverted ReleaseLoads {[load_id for load_id, _ in linked]} to PENDING (BOL {self.bol_number} deleted)")
 
         # Call parent delete
         super().delete(*args, **kwargs)
 
+    @classmethod
+    def bulk_delete(cls, qs):
+        """
+        Delete many BOLs at once, reverting their linked ReleaseLoads to PENDING.
+
+        Equivalent to calling delete() on each BOL, but issues one UPDATE for
+        all linked loads and one DELETE for the BOLs instead of a query pair
+        per BOL.
+
+        Returns:
+            int: Number of BOLs deleted
+        """
+        with transaction.atomic():
+            bol_ids = list(qs.values_list('id', flat=True))
+            if not bol_ids:
+                return 0
+            release_loads = ReleaseLoad.objects.filter(bol_id__in=bol_ids)
+            release_ids = set(release_loads.values_list('release_id', flat=True))
+            reverted = release_loads.update(
+                status='PENDING', bol=None, updated_at=timezone.now()
+            )
+            Release.refresh_load_counters(release_ids)
+            cls.objects.filter(id__in=bol_ids).delete()
+        logger.info(f"Bulk deleted {len(bol_ids)} BOLs, reverted {reverted} ReleaseLoads to PENDING")
+        return len(bol_ids)
+
+    # Columns returned by list_values() for JSON list endpoints
+    LIST_FIELDS = (
+        'id', 'bol_number', 'bol_date', 'date', 'product_name', 'buyer_name',
+        'carrier_name', 'truck_number', 'net_tons', 'official_weight_tons',
+        'is_void', 'bol_status', 'created_at',
+    )
+
+    @classmethod
+    def list_values(cls, *extra_fields):
+        """
+        Plain dict rows for list endpoints, skipping model instantiation.
+
+        Extra fields (including FK lookups like 'customer__customer') are
+        appended to LIST_FIELDS.
+        """
+        return cls.objects.values(*cls.LIST_FIELDS, *extra_fields)
+
     def __str__(self):
         return self.bol_number
 
@@ -395,11 +560,16 @@ class BOL(TimestampedModel):
             return self.pdf_url
         return None
 
-    def set_official_weight(self, weight_tons, entered_by_email):
-        """Set official weight, calculate variance, and generate watermarked PDF"""
+    def set_official_weight(self, weight_tons, entered_by_email, stamp_async=False):
+        """
+        Set official weight, calculate variance, and generate watermarked PDF.
+
+        With stamp_async=True the stamped PDF is rendered on the shared PDF
+        pool after commit; stamped_pdf_url stays empty until it is saved
+        (UIs fall back to pdf_url, and restamp_bol can redo a lost render).
+        """
         from django.utils import timezone
         from decimal import Decimal
-        from .pdf_watermark import watermark_bol_pdf
 
         self.official_weight_tons = Decimal(str(weight_tons))
         self.official_weight_entered_by = entered_by_email
@@ -412,20 +582,51 @@ class BOL(TimestampedModel):
         else:
             self.weight_variance_percent = Decimal('0.00')
 
-        self.save()
+        self.save(update_fields=[
+            'official_weight_tons', 'official_weight_entered_by', 'official_weight_entered_at',
+            'weight_variance_tons', 'weight_variance_percent', 'updated_at',
+        ])
+
+        if stamp_async:
+            submit_pdf_job_on_commit(BOL._stamp_pdf_in_background, self.pk)
+            return
+
+        self.generate_stamped_pdf()
+
+    def generate_stamped_pdf(self):
+        """Render the official-weight stamped PDF and store its URL."""
+        from .pdf_watermark import watermark_bol_pdf
 
         # Generate watermarked PDF with official weight stamp
         try:
             stamped_url = watermark_bol_pdf(self)
             if stamped_url:
                 self.stamped_pdf_url = stamped_url
-                self.save(update_fields=['stamped_pdf_url'])
+                self.save(update_fields=['stamped_pdf_url', 'updated_at'])
                 logger.info(f"Generated stamped PDF for BOL {self.bol_number}: {stamped_url}")
             else:
                 logger.warning(f"Failed to generate stamped PDF for BOL {self.bol_number}")
         except Exception as e:
             logger.error(f"Error generating stamped PDF for BOL {self.bol_number}: {str(e)}", exc_info=True)
 
+    @classmethod
+    def _stamp_pdf_in_background(cls, bol_id):
+        try:
+            cls.objects.get(pk=bol_id).generate_stamped_pdf()
+        except Exception as e:
+            logger.error(f"Background stamping failed for BOL id {bol_id}: {e}", exc_info=True)
+        finally:
+            close_old_connections()
+
+
+_pdf_render_pool = ThreadPoolExecutor(max_workers=PDF_RENDER_WORKERS, thread_name_prefix='bol-pdf')
+
+
+def submit_pdf_job_on_commit(fn, *args):
+    """Run a background PDF render on the shared pool once the transaction commits."""
+    transaction.on_commit(lambda: _pdf_render_pool.submit(fn, *args))
+
+
 class CompanyBranding(TimestampedModel):
     company_name = models.CharField(max_length=200, default="Cincinnati Barge & Rail Terminal, LLC")
     address_line1 = models.CharField(max_length=200, default="1707 Riverside Drive")
@@ -443,11 +644,18 @@ class CompanyBranding(TimestampedModel):
         if CompanyBranding.objects.exists() and not self.pk:
             raise ValueError("CompanyBranding is a singleton model")
         super().save(*args, **kwargs)
+        _company_branding.cache_clear()
     
     @classmethod
     def get_instance(cls):
-        instance, created = cls.objects.get_or_create(pk=1)
-        return instance
+        """
+        Return the branding singleton from the per-process cache.
+
+        Kept in process memory rather than Django's cache: the configured
+        backend is DatabaseCache, so a cache.get() would cost the same
+        round trip as reading the row.
+        """
+        return _company_branding(_config_ttl_bucket())
     
     def __str__(self):
         return self.company_name
@@ -543,6 +751,40 @@ class Lot(TimestampedModel):
             parts.append(f"Mn {self.mn:.3f}%")
         return " | ".join(parts)
 
+class ReleaseQuerySet(models.QuerySet):
+    def list_columns(self):
+        """
+        Load only the columns release list pages render.
+
+        Includes created_at (ordering/days open) and the denormalized load
+        counters so list rows never trigger deferred-field queries.
+        """
+        return self.only(
+            'id', 'release_number', 'release_date', 'customer_id_text', 'status',
+            'quantity_net_tons', 'created_at', 'total_loads_cached', 'loads_shipped_cached',
+        )
+
+    def with_loads(self):
+        """
+        Prefetch each release's shipped and pending loads in two queries.
+
+        Sets ``release.shipped_loads`` (newest date first, BOL joined) and
+        ``release.pending_loads`` (earliest date first).
+        """
+        return self.prefetch_related(
+            Prefetch(
+                'loads',
+                queryset=ReleaseLoad.objects.filter(status='SHIPPED').select_related('bol').order_by('-date'),
+                to_attr='shipped_loads',
+            ),
+            Prefetch(
+                'loads',
+                queryset=ReleaseLoad.objects.filter(status='PENDING').order_by('date'),
+                to_attr='pending_loads',
+            ),
+        )
+
+
 class Release(TimestampedModel):
     tenant = models.ForeignKey(
         Tenant, on_delete=models.CASCADE, null=True,
@@ -636,26 +878,99 @@ class Release(TimestampedModel):
         help_text="Override Manganese value for this release"
     )
 
+    # Denormalized load counters, kept current by ReleaseLoad signals (signals.py)
+    total_loads_cached = models.IntegerField(default=0, editable=False)
+    loads_shipped_cached = models.IntegerField(default=0, editable=False)
+
+    COUNTER_FIELDS = ('total_loads_cached', 'loads_shipped_cached')
+
+    objects = ReleaseQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         # Release number is unique per-tenant, not globally
         unique_together = [['tenant', 'release_number']]
 
+    def save(self, *args, **kwargs):
+        # Counters are maintained with F() updates; a full save of an existing
+        # release must not write back possibly stale in-memory values.
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"Release {self.release_number} ({self.customer_id_text})"
 
+    # Columns returned by list_values() for JSON list endpoints
+    LIST_FIELDS = (
+        'id', 'release_number', 'release_date', 'customer_id_text', 'customer_po',
+        'status', 'quantity_net_tons', 'material_description', 'lot',
+        'special_instructions', 'care_of_co', 'created_at',
+    )
+
+    @classmethod
+    def list_values(cls):
+        """
+        Plain dict rows for list endpoints, with denormalized load counts.
+
+        Each row has LIST_FIELDS plus total_loads and loads_shipped.
+        """
+        return cls.objects.values(
+            *cls.LIST_FIELDS,
+            total_loads=F('total_loads_cached'),
+            loads_shipped=F('loads_shipped_cached'),
+        )
+
+    @classmethod
+    def refresh_load_counters(cls, release_ids):
+        """
+        Recount denormalized load counters from ReleaseLoad rows.
+
+        Needed after queryset update()/bulk_create() on loads, which do not
+        fire the per-row signals that normally maintain the counters.
+        """
+        loads = ReleaseLoad.objects.filter(release=OuterRef('pk')).order_by().values('release')
+        cls.objects.filter(pk__in=release_ids).update(
+            total_loads_cached=Coalesce(Subquery(loads.annotate(n=Count('id')).values('n')), 0),
+            loads_shipped_cached=Coalesce(
+                Subquery(loads.filter(status='SHIPPED').annotate(n=Count('id')).values('n')), 0
+            ),
+        )
+
     @property
     def total_loads(self):
-        return self.loads.count()
+        return self.total_loads_cached
 
     @property
     def loads_shipped(self):
-        return self.loads.filter(status='SHIPPED').count()
+        return self.loads_shipped_cached
 
     @property
     def loads_remaining(self):
         return self.total_loads - self.loads_shipped
 
+    def shipped_tonnage(self):
+        """
+        Return (official_tons, planned_tons) for shipped loads.
+
+        A load counts its BOL's official weight when set, else its planned
+        tons. Uses ``shipped_loads`` from with_loads() when prefetched.
+        """
+        shipped = getattr(self, 'shipped_loads', None)
+        if shipped is None:
+            shipped = self.loads.filter(status='SHIPPED').select_related('bol')
+        official = planned = Decimal('0')
+        for load in shipped:
+            weight = load.bol.official_weight_tons if load.bol_id else None
+            if weight is not None:
+                official += weight
+            elif load.planned_tons is not None:
+                planned += load.planned_tons
+        return official, planned
+
     def format_override_chemistry(self):
         """Format override chemistry for BOL display when chemistry differs from lot."""
         parts = []
@@ -710,6 +1025,17 @@ class ReleaseLoad(TimestampedModel):
     class Meta:
         ordering = ['seq']
         unique_together = [['release', 'seq']]
+        indexes = [
+            models.Index(fields=['release', 'status'], name='rl_release_status_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Persisted status, used by the counter signals to compute deltas;
+        # when status was deferred the signals recount instead
+        instance._loaded_status = instance.__dict__.get('status', STATUS_NOT_LOADED)
+        return instance
 
     def __str__(self):
         return f"{self.release.release_number} load {self.seq}"
@@ -719,6 +1045,33 @@ class ReleaseLoad(TimestampedModel):
         """Alias for seq to match spec terminology."""
         return self.seq
 
+    @classmethod
+    def create_for_release(cls, release, count, planned_tons=None, dates=None, seqs=None, **fields):
+        """
+        Create ``count`` loads for a release in batched INSERTs.
+
+        bulk_create skips post_save, so the release's load counters are
+        recounted afterwards. ``dates`` and ``seqs`` are optional per-load
+        lists; a load without an explicit seq is numbered by its position
+        (1..count).
+        """
+        dates = list(dates or [])
+        seqs = list(seqs or [])
+        loads = [
+            cls(
+                release=release,
+                seq=(seqs[i - 1] if i <= len(seqs) else None) or i,
+                date=dates[i - 1] if i <= len(dates) else None,
+                planned_tons=planned_tons,
+                **fields,
+            )
+            for i in range(1, count + 1)
+        ]
+        created = cls.objects.bulk_create(loads, batch_size=500)
+        Release.refresh_load_counters([release.pk])
+        release.refresh_from_db(fields=Release.COUNTER_FIELDS)
+        return created
+
 
 class AuditLog(TimestampedModel):
     tenant = models.ForeignKey(
@@ -742,6 +1095,96 @@ class AuditLog(TimestampedModel):
     def __str__(self):
         return f"{self.action} {self.object_type} {self.object_id} by {self.user_email}";
 
+    @classmethod
+    def enqueue(cls, **fields):
+        """
+        Record an audit entry without an INSERT in the request path.
+
+        The row is queued once the surrounding transaction commits and
+        written by a background thread in batches. If the buffer is full
+        the row is written directly.
+        """
+        entry = cls(**fields)
+        transaction.on_commit(lambda: _buffer_audit_entry(entry))
+        return entry
+
+    @classmethod
+    def flush_queue(cls):
+        """
+        Write all buffered audit entries; returns how many were written.
+
+        If the batched INSERT fails, each entry is retried with its own
+        save() so one bad row or a transient error does not lose the whole
+        batch; entries that still cannot be written are logged individually.
+        """
+        batch = []
+        while True:
+            try:
+                batch.append(_audit_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return 0
+        try:
+            cls.objects.bulk_create(batch, batch_size=500)
+            return len(batch)
+        except Exception as e:
+            logger.warning(f"Audit bulk insert of {len(batch)} entries failed, saving one by one: {e}")
+
+        written = 0
+        for entry in batch:
+            entry.pk = None
+            try:
+                entry.save()
+                written += 1
+            except Exception as e:
+                logger.error(
+                    f"Dropped audit entry {entry.action} {entry.object_type} {entry.object_id} "
+                    f"by {entry.user_email}: {entry.message} ({e})"
+                )
+        return written
+
+
+_audit_queue = queue.Queue(maxsize=AUDIT_QUEUE_MAX_SIZE)
+_audit_writer = None
+_audit_writer_lock = threading.Lock()
+
+
+def _buffer_audit_entry(entry):
+    _start_audit_writer()
+    try:
+        _audit_queue.put_nowait(entry)
+    except queue.Full:
+        logger.warning("Audit queue full, writing entry directly")
+        entry.save()
+
+
+def _start_audit_writer():
+    """Start the per-process audit writer thread on first use."""
+    global _audit_writer
+    if _audit_writer is not None:
+        return
+    with _audit_writer_lock:
+        if _audit_writer is None:
+            _audit_writer = threading.Thread(target=_audit_writer_loop, name='audit-writer', daemon=True)
+            _audit_writer.start()
+            atexit.register(_flush_audit_queue)
+
+
+def _audit_writer_loop():
+    while True:
+        time.sleep(AUDIT_FLUSH_INTERVAL_SECONDS)
+        _flush_audit_queue()
+
+
+def _flush_audit_queue():
+    try:
+        AuditLog.flush_queue()
+    except Exception as e:
+        logger.warning(f"Audit log flush failed: {e}")
+    finally:
+        close_old_connections()
+
 
 class RoleRedirectConfig(models.Model):
     """
@@ -778,6 +1221,39 @@ class RoleRedirectConfig(models.Model):
         status = "✓" if self.is_active else "✗"
         return f"{status} {self.role_name} → {self.landing_page}"
 
+    @classmethod
+    def get_landing_page(cls, role_name):
+        """Return the active landing page for a role, or None if not configured."""
+        return _role_landing_page(role_name, _config_ttl_bucket())
+
+
+def _config_ttl_bucket(ttl_seconds=CONFIG_CACHE_TTL_SECONDS):
+    """Time bucket that rolls over every ``ttl_seconds``."""
+    return int(time.monotonic() // ttl_seconds)
+
+
+@lru_cache(maxsize=1)
+def _company_branding(ttl_bucket):
+    instance, created = CompanyBranding.objects.get_or_create(pk=1)
+    return instance
+
+
+@lru_cache(maxsize=64)
+def _active_tenant(code, ttl_bucket):
+    # lru_cache does not store exceptions, so raising keeps misses uncached
+    tenant = Tenant.objects.filter(code=code, is_active=True).first()
+    if tenant is None:
+        raise Tenant.DoesNotExist(code)
+    return tenant
+
+
+@lru_cache(maxsize=64)
+def _role_landing_page(role_name, ttl_bucket):
+    return RoleRedirectConfig.objects.filter(
+        role_name=role_name,
+        is_active=True
+    ).values_list('landing_page', flat=True).first()
+
 
 class UserCustomerAccess(models.Model):
     """
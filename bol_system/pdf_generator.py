@@ -5,147 +5,375 @@ Designed for black & white laser printers
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from types import SimpleNamespace
+import copy
+import hashlib
+import logging
 import os
+import re
 from io import BytesIO
-from django.conf import settings
 from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
+
+logger = logging.getLogger(__name__)
+
+
+# Page geometry: landscape letter (11" wide x 8.5" tall) with 0.3" margins
+_PAGE_SIZE = landscape(letter)
+_PAGE_MARGIN = 0.3*inch
+_FRAME_BOUNDS = (
+    _PAGE_MARGIN,
+    _PAGE_MARGIN,
+    _PAGE_SIZE[0] - 2*_PAGE_MARGIN,
+    _PAGE_SIZE[1] - 2*_PAGE_MARGIN,
+)
+
+# Styles are identical for every BOL; build them once per process
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'BOLTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=20,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold',
+    spaceAfter=4
+)
+
+_HEADER_STYLE = ParagraphStyle(
+    'Header',
+    parent=_STYLES['Normal'],
+    fontSize=8,
+    fontName='Helvetica-Bold'
+)
+
+_NORMAL_STYLE = ParagraphStyle(
+    'Normal',
+    parent=_STYLES['Normal'],
+    fontSize=8
+)
+
+_RIGHT_STYLE = ParagraphStyle('Right', parent=_NORMAL_STYLE, alignment=TA_RIGHT)
+
+_CENTER_STYLE = ParagraphStyle('Center', parent=_NORMAL_STYLE, alignment=TA_CENTER)
+
+_NOTES_STYLE = ParagraphStyle('Notes', parent=_NORMAL_STYLE, fontSize=8, leading=10)
+
+_CRITICAL_STYLE = ParagraphStyle(
+    'Critical',
+    parent=_NORMAL_STYLE,
+    fontSize=12,
+    leading=16,
+    textColor=colors.HexColor('#8B0000'),  # Dark red
+    alignment=1  # Center
+)
+
+# Table styles only hold drawing commands, so one instance serves every render
+_HEADER_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
+
+_RULE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.black),
+])
+
+_LEFT_COL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#E0E0E0')),
+    ('BACKGROUND', (0, 3), (0, 3), colors.HexColor('#E0E0E0')),
+    ('BOX', (0, 0), (-1, -1), 1, colors.black),
+    ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+])
+
+# Header row spanning label/value rows; the outer 6pt/4pt insets are folded
+# into the edge cells so the block lays out as one flat table
+_RIGHT_COL_TABLE_STYLE = TableStyle([
+    ('SPAN', (0, 0), (1, 0)),
+    ('BACKGROUND', (0, 0), (1, 0), colors.HexColor('#E0E0E0')),
+    ('BOX', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, 0), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 4),
+    ('RIGHTPADDING', (0, 1), (0, -1), 0),
+    ('LEFTPADDING', (1, 1), (1, -1), 0),
+    ('TOPPADDING', (0, 1), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 3),
+    ('TOPPADDING', (0, 1), (-1, 1), 7),
+    ('BOTTOMPADDING', (0, -1), (-1, -1), 7),
+])
+
+_MAIN_INFO_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+])
+
+_MATERIAL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E0E0E0')),
+    ('BOX', (0, 0), (-1, -1), 1, colors.black),
+    ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+])
+
+_NOTES_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#F5F5F5')),
+    ('BOX', (0, 0), (-1, -1), 1, colors.black),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+])
+
+_CRITICAL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#FFF4E6')),  # Light orange/yellow
+    ('BOX', (0, 0), (-1, -1), 3, colors.HexColor('#FF6B00')),  # Thick orange border
+    ('TOPPADDING', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('LEFTPADDING', (0, 0), (-1, -1), 12),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+])
+
+_SIGNATURE_TABLE_STYLE = TableStyle([
+    ('BOX', (0, 0), (-1, -1), 1, colors.black),
+    ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+])
+
+# Dict (preview/API) input keys: field -> (preferred key, fallback key, default)
+_FIELD_MAP = {
+    'bol_number': ('bolNumber', 'bol_number', 'PREVIEW'),
+    'customer_po': ('customerPO', 'customer_po', ''),
+    'carrier_name': ('carrierName', 'carrier_name', ''),
+    'truck_number': ('truckNumber', 'truck_number', ''),
+    'trailer_number': ('trailerNumber', 'trailer_number', ''),
+    'buyer_name': ('buyerName', 'buyer_name', ''),
+    'ship_to': ('shipTo', 'ship_to', ''),
+    'product_name': ('productName', 'product_name', ''),
+    'net_tons': ('netTons', 'net_tons', 0),
+    'release_number': ('releaseNumber', 'release_number', ''),
+    'lot_ref': ('lot_ref', 'lotRef', None),
+    'special_instructions': ('specialInstructions', 'special_instructions', ''),
+}
+
+# Other dict keys the renderer reads as-is (missing -> '')
+_PASSTHROUGH_KEYS = ('date', 'bol_date', 'care_of_co', 'release_line', '_total_lbs')
+
+# Rendered PDFs are stored under a hash of their inputs (see _storage_name);
+# bump when the layout changes so stored copies are re-rendered
+_LAYOUT_VERSION = 1
+
+# Names produced by _storage_name (stamped copies end in -stamped.pdf instead)
+_RENDER_NAME_RE = re.compile(r'^bols/\d{4}/.+-[0-9a-f]{16}\.pdf$')
+
+_FINGERPRINT_FIELDS = (
+    'bol_number', 'date', 'bol_date', 'customer_po', 'carrier_name', 'truck_number',
+    'trailer_number', 'buyer_name', 'ship_to', 'product_name', 'net_tons',
+    'release_number', 'special_instructions', 'care_of_co',
+)
+
+# Analysis line order: (label, Lot field, Release override field)
+_CHEMISTRY_ELEMENTS = tuple(
+    (label, attr, f'chemistry_override_{attr}')
+    for label, attr in (('C', 'c'), ('Si', 'si'), ('S', 's'), ('P', 'p'), ('Mn', 'mn'))
+)
+
+# Invariant text blocks printed on every BOL
+_SHIP_FROM_TEXT = (
+    '<b>Cincinnati Barge & Rail Terminal, LLC</b><br/>c/o {co_company}<br/>'
+    '1707 Riverside Drive<br/>Cincinnati, Ohio 45202<br/>Phone: (513) 721-1707'
+)
+
+_NOTES_TEXT = (
+    '<b>IMPORTANT NOTES:</b><br/>'
+    '• Weights referenced are estimates. See scale ticket for actual weight.<br/>'
+    '• Liability Limitation for loss or damage in this shipment may be applicable. See 49 U.S.C. § 14706(c)(1)(A) and (B).<br/>'
+    '• Material is non-hazardous.<br/>'
+    '• This is to certify that the above named materials are properly classified, packaged, marked and labeled, and are in proper condition for transportation according to the applicable regulations of the DOT.'
+)
+
+_SHIPPER_SIGNATURE_TEXT = (
+    '<b>SHIPPER SIGNATURE</b><br/><br/>_____________________________<br/>'
+    'James Rose<br/><font size="7">Authorized Representative</font>'
+)
+
+_CARRIER_SIGNATURE_TEXT = (
+    '<b>CARRIER SIGNATURE</b><br/><br/>_____________________________<br/>'
+    'Driver Name<br/><font size="7">Date / Time</font>'
+)
+
+
+@lru_cache(maxsize=1)
+def _build_static_elements():
+    """Parse the paragraphs that never vary between BOLs, once per process."""
+    return {
+        'title': Paragraph('<b>BILL OF LADING</b>', _TITLE_STYLE),
+        'notes': Paragraph(_NOTES_TEXT, _NOTES_STYLE),
+        # Section headers
+        'ship_from_header': Paragraph('<b>SHIP FROM:</b>', _HEADER_STYLE),
+        'consignee_header': Paragraph('<b>CONSIGNEE (SHIP TO):</b>', _HEADER_STYLE),
+        'shipment_header': Paragraph('<b>SHIPMENT INFORMATION</b>', _HEADER_STYLE),
+        'material_header': Paragraph('<b>MATERIAL DESCRIPTION</b>', _HEADER_STYLE),
+        'lot_header': Paragraph('<b>LOT NUMBER</b>', _HEADER_STYLE),
+        'weight_header': Paragraph('<b>WEIGHT</b>', _HEADER_STYLE),
+        # Shipment information labels
+        'date_label': Paragraph('<b>Date:</b>', _NORMAL_STYLE),
+        'po_label': Paragraph('<b>Customer PO#:</b>', _NORMAL_STYLE),
+        'release_label': Paragraph('<b>Release #:</b>', _NORMAL_STYLE),
+        'carrier_label': Paragraph('<b>Carrier:</b>', _NORMAL_STYLE),
+        'truck_label': Paragraph('<b>Truck #:</b>', _NORMAL_STYLE),
+        'trailer_label': Paragraph('<b>Trailer #:</b>', _NORMAL_STYLE),
+        # Black rule under the header
+        'rule': Table([['']], colWidths=[10*inch], rowHeights=[0.02*inch], style=_RULE_TABLE_STYLE),
+        # Signature row (no per-BOL content)
+        'signatures': Table(
+            [[Paragraph(_SHIPPER_SIGNATURE_TEXT, _NORMAL_STYLE), Paragraph(_CARRIER_SIGNATURE_TEXT, _NORMAL_STYLE)]],
+            colWidths=[4.7*inch, 4.7*inch],
+            style=_SIGNATURE_TABLE_STYLE,
+        ),
+    }
+
+
+def _namespace_from_dict(d):
+    """Resolve a camelCase/snake_case BOL dict into plain attributes, once per render."""
+    fields = {key: d.get(key, '') for key in _PASSTHROUGH_KEYS}
+    for field, (primary, fallback, default) in _FIELD_MAP.items():
+        fields[field] = d.get(primary) or d.get(fallback, default)
+    return SimpleNamespace(**fields)
+
+
+@lru_cache(maxsize=256)
+def _format_date(value):
+    """Format an ISO 'YYYY-MM-DD' BOL date as MM/DD/YYYY; other values pass through."""
+    try:
+        return datetime.fromisoformat(value).strftime('%m/%d/%Y')
+    except (TypeError, ValueError):
+        return value
+
+
+@lru_cache(maxsize=256)
+def _date_year(value):
+    """Year of an ISO 'YYYY-MM-DD' BOL date, or None if it does not parse."""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').year
+    except (TypeError, ValueError):
+        return None
+
+
+def _page_template():
+    """
+    Single-frame page template for a BOL.
+
+    Frames track the flow position while a document builds, so each render
+    gets its own instance; only the geometry is shared.
+    """
+    return PageTemplate(id='bol', frames=[Frame(*_FRAME_BOUNDS, id='normal')])
 
 
-def generate_bol_pdf(bol_data, output_path=None, return_bytes=False):
+def _static(name):
+    """
+    Return a per-render copy of a prebuilt static flowable.
+
+    wrap() stores layout state on the flowable and gunicorn runs threaded
+    workers, so the shared instance is copied (without re-parsing markup).
+    Tables also get copies of their cells, which are wrapped in turn.
+    """
+    element = copy.copy(_build_static_elements()[name])
+    if isinstance(element, Table):
+        element._cellvalues = [[copy.copy(cell) for cell in row] for row in element._cellvalues]
+    return element
+
+
+def generate_bol_pdf(bol_data, output_path=None, return_bytes=False, force=False):
     """
     Generate a professional BOL PDF
 
     Args:
         bol_data: BOL model object or dictionary with BOL data
-        output_path: Optional custom output path
+        output_path: Optional local file path, or a writable file-like object
+            (e.g. an HttpResponse) that receives the PDF bytes directly
         return_bytes: If True, return PDF as bytes instead of saving to storage
+        force: Re-render and replace the stored PDF even if identical content
+            is already stored (used by the regenerate paths)
 
     Returns:
         If return_bytes=True: PDF bytes
-        If output_path provided: The local file path
+        If output_path provided: output_path (the path or file-like object)
         Otherwise: S3 signed URL
     """
-    # Handle both model objects and dictionaries
-    if hasattr(bol_data, '__dict__') and not isinstance(bol_data, dict):
-        # It's a model object
-        data = bol_data
+    # Model objects are read directly; dicts are resolved once into a namespace
+    # carrying every BOL field, so the body never needs to probe for attributes
+    if isinstance(bol_data, dict):
+        data = _namespace_from_dict(bol_data)
     else:
-        # It's a dictionary, create attribute-style accessor
-        class DictWrapper:
-            def __init__(self, d):
-                self._data = d
-            def __getattr__(self, key):
-                if key == 'bol_number':
-                    return self._data.get('bolNumber') or self._data.get('bol_number', 'PREVIEW')
-                elif key == 'customer_po':
-                    return self._data.get('customerPO') or self._data.get('customer_po', '')
-                elif key == 'carrier_name':
-                    return self._data.get('carrierName') or self._data.get('carrier_name', '')
-                elif key == 'truck_number':
-                    return self._data.get('truckNumber') or self._data.get('truck_number', '')
-                elif key == 'trailer_number':
-                    return self._data.get('trailerNumber') or self._data.get('trailer_number', '')
-                elif key == 'buyer_name':
-                    return self._data.get('buyerName') or self._data.get('buyer_name', '')
-                elif key == 'ship_to':
-                    return self._data.get('shipTo') or self._data.get('ship_to', '')
-                elif key == 'product_name':
-                    return self._data.get('productName') or self._data.get('product_name', '')
-                elif key == 'net_tons':
-                    return self._data.get('netTons') or self._data.get('net_tons', 0)
-                elif key == 'date':
-                    return self._data.get('date', '')
-                elif key == 'release_number':
-                    return self._data.get('releaseNumber') or self._data.get('release_number', '')
-                elif key == 'lot_ref':
-                    return self._data.get('lot_ref') or self._data.get('lotRef', None)
-                elif key == 'special_instructions':
-                    return self._data.get('specialInstructions') or self._data.get('special_instructions', '')
-                return self._data.get(key, '')
-        data = DictWrapper(bol_data)
+        data = bol_data
+
+    # Identical content was already rendered and stored: reuse that file
+    storage_name = None
+    if not return_bytes and output_path is None:
+        storage_name = _storage_name(data)
+        if not force and default_storage.exists(storage_name):
+            return default_storage.url(storage_name)
 
     # Generate PDF to memory buffer (works with both S3 and local storage)
     buffer = BytesIO()
 
     # Create PDF in landscape for more space
-    doc = SimpleDocTemplate(
+    doc = BaseDocTemplate(
         buffer,
-        pagesize=landscape(letter),  # 11" wide x 8.5" tall
-        rightMargin=0.3*inch,
-        leftMargin=0.3*inch,
-        topMargin=0.3*inch,
-        bottomMargin=0.3*inch
+        pagesize=_PAGE_SIZE,
+        rightMargin=_PAGE_MARGIN,
+        leftMargin=_PAGE_MARGIN,
+        topMargin=_PAGE_MARGIN,
+        bottomMargin=_PAGE_MARGIN,
+        pageCompression=1,  # zlib content streams regardless of rl_config
     )
+    doc.addPageTemplates([_page_template()])
 
     elements = []
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        'BOLTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold',
-        spaceAfter=4
-    )
-
-    header_style = ParagraphStyle(
-        'Header',
-        parent=styles['Normal'],
-        fontSize=8,
-        fontName='Helvetica-Bold'
-    )
-
-    normal_style = ParagraphStyle(
-        'Normal',
-        parent=styles['Normal'],
-        fontSize=8
-    )
 
     # ========== HEADER SECTION ==========
-    # Load logos
-    cbrt_logo_path = os.path.join(settings.BASE_DIR, 'static', 'cbrt-logo.jpg')
-    prime_logo_path = os.path.join(settings.BASE_DIR, 'static', 'primetrade-logo.jpg')
-
-    cbrt_logo = None
-    prime_logo = None
-
-    # Format date
-    try:
-        date_obj = datetime.strptime(data.date, '%Y-%m-%d')
-        formatted_date = date_obj.strftime('%m/%d/%Y')
-    except:
-        formatted_date = data.date
+    bol_date = data.bol_date
+    if hasattr(bol_date, 'strftime'):
+        formatted_date = bol_date.strftime('%m/%d/%Y')
+    else:
+        formatted_date = _format_date(data.date)
 
     # Header table: No logos - clean and simple
     header_data = [[
         # Left: BILL OF LADING title
-        Paragraph('<b>BILL OF LADING</b>', title_style),
+        _static('title'),
 
         # Right: BOL Number
-        Paragraph(f'<para align="right"><font size="7">BOL NUMBER</font><br/><b><font size="14">{data.bol_number}</font></b></para>', normal_style),
+        Paragraph(f'<font size="7">BOL NUMBER</font><br/><b><font size="14">{data.bol_number}</font></b>', _RIGHT_STYLE),
     ]]
 
-    header_table = Table(header_data, colWidths=[6.0*inch, 4.0*inch])
-    header_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    header_table = Table(header_data, colWidths=[6.0*inch, 4.0*inch], style=_HEADER_TABLE_STYLE)
 
     elements.append(header_table)
 
     # Horizontal line
-    line_table = Table([['']], colWidths=[10*inch], rowHeights=[0.02*inch])
-    line_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.black),
-    ]))
-    elements.append(line_table)
+    elements.append(_static('rule'))
     elements.append(Spacer(1, 0.02*inch))
 
     # ========== MAIN INFO SECTION (TWO COLUMNS) ==========
@@ -153,252 +381,316 @@ def generate_bol_pdf(bol_data, output_path=None, return_bytes=False):
     lot_number = ''
     chemistry_text = 'N/A'
 
-    # Check for release override chemistry first
-    release_override = None
-    if hasattr(data, 'release_line') and data.release_line:
-        release_override = data.release_line.release
-
-    if hasattr(data, 'lot_ref') and data.lot_ref:
-        lot = data.lot_ref
+    lot = data.lot_ref
+    if lot:
         lot_number = lot.code
 
-        # Build chemistry string - use release override values if present, else lot values
+        # Release override chemistry wins over lot values, element by element
+        release_line = data.release_line
+        release_override = release_line.release if release_line else None
+
         chem_parts = []
+        for label, lot_attr, override_attr in _CHEMISTRY_ELEMENTS:
+            value = getattr(release_override, override_attr) if release_override else None
+            if value is None:
+                value = getattr(lot, lot_attr)
+            if value is not None:
+                # Chemistry fields are 3-place Decimals; format them without a float round trip
+                chem_parts.append(f'{label} {value:.3f}%')
 
-        # Carbon
-        if release_override and release_override.chemistry_override_c is not None:
-            chem_parts.append(f'C {float(release_override.chemistry_override_c):.3f}%')
-        elif lot.c is not None:
-            chem_parts.append(f'C {float(lot.c):.3f}%')
-
-        # Silicon
-        if release_override and release_override.chemistry_override_si is not None:
-            chem_parts.append(f'Si {float(release_override.chemistry_override_si):.3f}%')
-        elif lot.si is not None:
-            chem_parts.append(f'Si {float(lot.si):.3f}%')
-
-        # Sulfur
-        if release_override and release_override.chemistry_override_s is not None:
-            chem_parts.append(f'S {float(release_override.chemistry_override_s):.3f}%')
-        elif lot.s is not None:
-            chem_parts.append(f'S {float(lot.s):.3f}%')
-
-        # Phosphorus
-        if release_override and release_override.chemistry_override_p is not None:
-            chem_parts.append(f'P {float(release_override.chemistry_override_p):.3f}%')
-        elif lot.p is not None:
-            chem_parts.append(f'P {float(lot.p):.3f}%')
-
-        # Manganese
-        if release_override and release_override.chemistry_override_mn is not None:
-            chem_parts.append(f'Mn {float(release_override.chemistry_override_mn):.3f}%')
-        elif lot.mn is not None:
-            chem_parts.append(f'Mn {float(lot.mn):.3f}%')
-
-        if chem_parts:
-            chemistry_text = ' | '.join(chem_parts)
+        chemistry_text = ' | '.join(chem_parts) or chemistry_text
 
     release_num = ''
-    if hasattr(data, 'release_number') and data.release_number:
+    if data.release_number:
         release_num = data.release_number
 
-    # Calculate weights (short tons: 2000 lbs/ton)
-    total_weight_lbs = int(float(data.net_tons) * 2000) if data.net_tons else 0
-    net_tons = float(data.net_tons) if data.net_tons else 0
+    # Calculate weights (short tons: 2000 lbs/ton). Models hold Decimal tons;
+    # dict input may carry floats or strings, which are brought to Decimal once
+    net_tons = data.net_tons or 0
+    if not isinstance(net_tons, Decimal):
+        net_tons = Decimal(str(net_tons))
+    total_lbs = getattr(data, '_total_lbs', None)
+    if total_lbs not in (None, ''):
+        total_weight_lbs = int(total_lbs)
+    else:
+        total_weight_lbs = int(net_tons * 2000)
 
     # Left column: Ship From + Consignee
     # Get c/o company from BOL data (defaults to PrimeTrade, LLC for backward compatibility)
-    co_company = getattr(data, 'care_of_co', None) or 'PrimeTrade, LLC'
+    co_company = data.care_of_co or 'PrimeTrade, LLC'
+    ship_to = data.ship_to.replace('\n', '<br/>')
 
     left_col_data = [
-        [Paragraph('<b>SHIP FROM:</b>', header_style)],
-        [Paragraph(f'<b>Cincinnati Barge & Rail Terminal, LLC</b><br/>c/o {co_company}<br/>1707 Riverside Drive<br/>Cincinnati, Ohio 45202<br/>Phone: (513) 721-1707', normal_style)],
+        [_static('ship_from_header')],
+        [Paragraph(_SHIP_FROM_TEXT.format(co_company=co_company), _NORMAL_STYLE)],
         [Spacer(1, 0.05*inch)],
-        [Paragraph('<b>CONSIGNEE (SHIP TO):</b>', header_style)],
-        [Paragraph(f'<b>{data.buyer_name}</b><br/><font size="7">{data.ship_to.replace(chr(10), "<br/>")}</font>', normal_style)]
+        [_static('consignee_header')],
+        [Paragraph(f'<b>{data.buyer_name}</b><br/><font size="7">{ship_to}</font>', _NORMAL_STYLE)]
     ]
 
-    left_col_table = Table(left_col_data, colWidths=[4.5*inch])
-    left_col_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#E0E0E0')),
-        ('BACKGROUND', (0, 3), (0, 3), colors.HexColor('#E0E0E0')),
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    left_col_table = Table(left_col_data, colWidths=[4.5*inch], style=_LEFT_COL_TABLE_STYLE)
 
     # Right column: Shipment details
     right_col_data = [
-        [Paragraph('<b>SHIPMENT INFORMATION</b>', header_style)],
-        [Table([
-            [Paragraph('<b>Date:</b>', normal_style), Paragraph(formatted_date, normal_style)],
-            [Paragraph('<b>Customer PO#:</b>', normal_style), Paragraph(data.customer_po or '', normal_style)],
-            [Paragraph('<b>Release #:</b>', normal_style), Paragraph(release_num, normal_style)],
-            [Paragraph('<b>Carrier:</b>', normal_style), Paragraph(data.carrier_name, normal_style)],
-            [Paragraph('<b>Truck #:</b>', normal_style), Paragraph(data.truck_number, normal_style)],
-            [Paragraph('<b>Trailer #:</b>', normal_style), Paragraph(data.trailer_number, normal_style)],
-        ], colWidths=[1.2*inch, 3*inch], style=TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ('TOPPADDING', (0, 0), (-1, -1), 3),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        ]))]
+        [_static('shipment_header'), ''],
+        [_static('date_label'), Paragraph(formatted_date, _NORMAL_STYLE)],
+        [_static('po_label'), Paragraph(data.customer_po or '', _NORMAL_STYLE)],
+        [_static('release_label'), Paragraph(release_num, _NORMAL_STYLE)],
+        [_static('carrier_label'), Paragraph(data.carrier_name, _NORMAL_STYLE)],
+        [_static('truck_label'), Paragraph(data.truck_number, _NORMAL_STYLE)],
+        [_static('trailer_label'), Paragraph(data.trailer_number, _NORMAL_STYLE)],
     ]
 
-    right_col_table = Table(right_col_data, colWidths=[4.5*inch])
-    right_col_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#E0E0E0')),
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    right_col_table = Table(right_col_data, colWidths=[1.2*inch + 6, 3.3*inch - 6], style=_RIGHT_COL_TABLE_STYLE)
 
     # Combine left and right columns
-    main_info_table = Table([[left_col_table, right_col_table]], colWidths=[4.7*inch, 4.7*inch])
-    main_info_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-    ]))
+    main_info_table = Table([[left_col_table, right_col_table]], colWidths=[4.7*inch, 4.7*inch], style=_MAIN_INFO_TABLE_STYLE)
 
     elements.append(main_info_table)
     elements.append(Spacer(1, 0.03*inch))
 
     # ========== MATERIAL/PRODUCT SECTION ==========
     material_data = [[
-        Paragraph(f'<b>MATERIAL DESCRIPTION</b>', header_style),
-        Paragraph(f'<b>LOT NUMBER</b>', header_style),
-        Paragraph(f'<b>WEIGHT</b>', header_style)
+        _static('material_header'),
+        _static('lot_header'),
+        _static('weight_header'),
     ]]
 
     material_data.append([
-        Paragraph(f'<b>{data.product_name}</b><br/><font size="8">Analysis: {chemistry_text}</font>', normal_style),
-        Paragraph(f'<para align="center"><b>{lot_number or "N/A"}</b></para>', normal_style),
-        Paragraph(f'<para align="center"><b>{total_weight_lbs:,} LBS</b><br/><b>{net_tons:.2f} N.T.</b></para>', normal_style)
+        Paragraph(f'<b>{data.product_name}</b><br/><font size="8">Analysis: {chemistry_text}</font>', _NORMAL_STYLE),
+        Paragraph(f'<b>{lot_number or "N/A"}</b>', _CENTER_STYLE),
+        Paragraph(f'<b>{total_weight_lbs:,} LBS</b><br/><b>{net_tons:.2f} N.T.</b>', _CENTER_STYLE)
     ])
 
-    material_table = Table(material_data, colWidths=[5*inch, 2*inch, 2.4*inch])
-    material_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E0E0E0')),
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    material_table = Table(material_data, colWidths=[5*inch, 2*inch, 2.4*inch], style=_MATERIAL_TABLE_STYLE)
 
     elements.append(material_table)
     elements.append(Spacer(1, 0.02*inch))
 
     # ========== NOTES/DISCLAIMER SECTION ==========
-    notes_text = '<b>IMPORTANT NOTES:</b><br/>'
-    notes_text += '• Weights referenced are estimates. See scale ticket for actual weight.<br/>'
-    notes_text += '• Liability Limitation for loss or damage in this shipment may be applicable. See 49 U.S.C. § 14706(c)(1)(A) and (B).<br/>'
-    notes_text += '• Material is non-hazardous.<br/>'
-    notes_text += '• This is to certify that the above named materials are properly classified, packaged, marked and labeled, and are in proper condition for transportation according to the applicable regulations of the DOT.'
-
-    notes_table = Table([[Paragraph(notes_text, ParagraphStyle('Notes', parent=normal_style, fontSize=8, leading=10))]], colWidths=[9.4*inch])
-    notes_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#F5F5F5')),
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    notes_table = Table([[_static('notes')]], colWidths=[9.4*inch], style=_NOTES_TABLE_STYLE)
 
     elements.append(notes_table)
     elements.append(Spacer(1, 0.03*inch))
 
     # ========== CRITICAL DELIVERY INSTRUCTIONS ==========
     # Display prominently if present
-    if hasattr(data, 'special_instructions') and data.special_instructions:
+    if data.special_instructions:
         special = data.special_instructions.strip()
         if special:
             # Replace newlines with <br/> for proper rendering
             special = special.replace('\n', '<br/>')
 
-            # Create prominent alert-style box for critical instructions
-            critical_style = ParagraphStyle(
-                'Critical',
-                parent=normal_style,
-                fontSize=12,
-                leading=16,
-                textColor=colors.HexColor('#8B0000'),  # Dark red
-                alignment=1  # Center
-            )
-
             critical_text = f'<b>⚠ CRITICAL DELIVERY INSTRUCTION ⚠</b><br/><br/>{special}'
-            critical_table = Table([[Paragraph(critical_text, critical_style)]], colWidths=[9.4*inch])
-            critical_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#FFF4E6')),  # Light orange/yellow
-                ('BOX', (0, 0), (-1, -1), 3, colors.HexColor('#FF6B00')),  # Thick orange border
-                ('TOPPADDING', (0, 0), (-1, -1), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                ('LEFTPADDING', (0, 0), (-1, -1), 12),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ]))
+            critical_table = Table([[Paragraph(critical_text, _CRITICAL_STYLE)]], colWidths=[9.4*inch], style=_CRITICAL_TABLE_STYLE)
 
             elements.append(critical_table)
             elements.append(Spacer(1, 0.02*inch))
 
     # ========== SIGNATURE SECTION ==========
-    sig_data = [[
-        Paragraph('<b>SHIPPER SIGNATURE</b><br/><br/>_____________________________<br/>James Rose<br/><font size="7">Authorized Representative</font>', normal_style),
-        Paragraph('<b>CARRIER SIGNATURE</b><br/><br/>_____________________________<br/>Driver Name<br/><font size="7">Date / Time</font>', normal_style)
-    ]]
+    elements.append(_static('signatures'))
 
-    sig_table = Table(sig_data, colWidths=[4.7*inch, 4.7*inch])
-    sig_table.setStyle(TableStyle([
-        ('BOX', (0, 0), (-1, -1), 1, colors.black),
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        ('LEFTPADDING', (0, 0), (-1, -1), 4),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ]))
-
-    elements.append(sig_table)
-
-    # Build PDF
+    # Build PDF entirely in memory, then hand the finished bytes out once
     doc.build(elements)
 
     # If return_bytes is True, return raw PDF bytes (for kiosk inline display)
     if return_bytes:
-        buffer.seek(0)
-        return buffer.read()
-
-    # If output_path is provided (for preview mode), save to local file
-    if output_path:
-        buffer.seek(0)
-        with open(output_path, 'wb') as f:
-            f.write(buffer.read())
+        return buffer.getvalue()
+
+    # If output_path is provided (for preview mode), write it out in one call
+    if output_path is not None:
+        pdf_bytes = buffer.getvalue()
+        if hasattr(output_path, 'write'):
+            output_path.write(pdf_bytes)
+        else:
+            with open(output_path, 'wb') as f:
+                f.write(pdf_bytes)
         return output_path
 
     # Otherwise, save to storage (S3 in production, local filesystem in development)
+    # straight from the render buffer, without copying the bytes out first
     buffer.seek(0)
+    return _save_pdf_to_storage(storage_name, File(buffer, name=storage_name), replace=force)
+
+
+def _render_fingerprint(data):
+    """Short hash of everything generate_bol_pdf prints for this BOL."""
+    values = [_LAYOUT_VERSION] + [getattr(data, field) for field in _FINGERPRINT_FIELDS]
+    lot = data.lot_ref
+    if lot:
+        values += [lot.code, lot.c, lot.si, lot.s, lot.p, lot.mn]
+    release_line = data.release_line
+    if release_line:
+        release = release_line.release
+        values += [getattr(release, f'chemistry_override_{el}') for el in ('c', 'si', 's', 'p', 'mn')]
+    return hashlib.blake2b(repr(values).encode(), digest_size=8).hexdigest()
 
+
+def _storage_name(data):
+    """Storage path for a rendered BOL: bols/YYYY/PRT-YYYY-NNNN-<fingerprint>.pdf"""
     # Organize by year for better file management
+    year = _date_year(data.date) or datetime.now().year
+    return f"bols/{year}/{data.bol_number}-{_render_fingerprint(data)}.pdf"
+
+
+def _storage_key(url):
+    """Storage key of a stored BOL PDF from its S3 or local URL."""
+    path = url.split('?')[0]
+    if 'amazonaws.com/' in path:
+        return path.split('amazonaws.com/')[-1]
+    return path.replace('/media/', '', 1).lstrip('/')
+
+
+def delete_superseded_pdf(old_url, new_url):
+    """
+    Delete a BOL's previous render after regeneration stored a new one.
+
+    Renders are named by content, so a BOL whose data changed gets a new file
+    and nothing references the old one once pdf_url/pdf_key are updated.
+    Only fingerprinted renders are removed; legacy names and stamped copies
+    (still referenced by stamped_pdf_url) are left alone.
+    """
+    if not old_url or not new_url:
+        return
+    old_key = _storage_key(old_url)
+    if old_key == _storage_key(new_url) or not _RENDER_NAME_RE.match(old_key):
+        return
     try:
-        date_obj = datetime.strptime(data.date, '%Y-%m-%d')
-        year = date_obj.year
-    except:
-        year = datetime.now().year
+        default_storage.delete(old_key)
+    except Exception as e:
+        logger.warning(f"Could not delete superseded PDF {old_key}: {e}")
+
 
-    # Generate file path: bols/YYYY/PRT-YYYY-NNNN.pdf
-    filename = f"bols/{year}/{data.bol_number}.pdf"
+def _save_pdf_to_storage(filename, pdf, replace=False):
+    """
+    Save a rendered BOL (bytes or a File) under ``filename`` and return the storage URL.
+
+    With ``replace=True`` an existing object at ``filename`` is deleted first, so
+    the new render takes its place instead of being saved under a suffixed name.
+    """
+    if isinstance(pdf, bytes):
+        pdf = ContentFile(pdf)
+
+    if replace and default_storage.exists(filename):
+        default_storage.delete(filename)
 
     # Save using Django storage backend (automatically uses S3 or filesystem)
-    saved_path = default_storage.save(filename, ContentFile(buffer.read()))
+    saved_path = default_storage.save(filename, pdf)
 
     # Return URL (automatically generates signed URL if using S3)
     return default_storage.url(saved_path)
+
+
+def _bol_to_render_dict(bol):
+    """
+    Snapshot a BOL model into a picklable dict for generate_bol_pdf_from_dict.
+
+    Lot chemistry and release overrides are copied into SimpleNamespaces so
+    worker processes never touch the ORM.
+    """
+    lot = bol.lot_ref
+    release = bol.release_line.release if bol.release_line_id else None
+    return {
+        'bol_number': bol.bol_number,
+        'customer_po': bol.customer_po,
+        'carrier_name': bol.carrier_name,
+        'truck_number': bol.truck_number,
+        'trailer_number': bol.trailer_number,
+        'buyer_name': bol.buyer_name,
+        'ship_to': bol.ship_to,
+        'product_name': bol.product_name,
+        'net_tons': bol.net_tons,
+        '_total_lbs': getattr(bol, '_total_lbs', None),
+        'date': bol.date,
+        'bol_date': bol.bol_date,
+        'release_number': bol.release_number,
+        'special_instructions': bol.special_instructions,
+        'care_of_co': bol.care_of_co,
+        'lot_ref': SimpleNamespace(
+            code=lot.code, c=lot.c, si=lot.si, s=lot.s, p=lot.p, mn=lot.mn
+        ) if lot else None,
+        'release_line': SimpleNamespace(release=SimpleNamespace(
+            chemistry_override_c=release.chemistry_override_c,
+            chemistry_override_si=release.chemistry_override_si,
+            chemistry_override_s=release.chemistry_override_s,
+            chemistry_override_p=release.chemistry_override_p,
+            chemistry_override_mn=release.chemistry_override_mn,
+        )) if release else None,
+    }
+
+
+def generate_bol_pdf_from_dict(data):
+    """Render a BOL snapshot dict to PDF bytes. Safe to run in a worker process."""
+    return generate_bol_pdf(data, return_bytes=True)
+
+
+def _init_render_worker():
+    """
+    Process-pool initializer for bulk rendering.
+
+    Spawned workers (the default start method off Linux) import this module
+    without Django configured, so set it up once, then prebuild the static
+    flowables before the first BOL arrives.
+    """
+    from django.apps import apps
+    if not apps.ready:
+        import django
+        django.setup()
+    _build_static_elements()
+
+
+def generate_bol_pdfs(bols, **kwargs):
+    """
+    Render BOLs one after another in this process, yielding each result.
+
+    Static flowables are built once before the first document, so every BOL
+    in the batch only pays for its own content. ``kwargs`` are passed through
+    to generate_bol_pdf (e.g. ``return_bytes=True``).
+    """
+    _build_static_elements()
+    for bol in bols:
+        yield generate_bol_pdf(bol, **kwargs)
+
+
+def generate_bols_bulk(bol_ids, max_workers=None, force=False):
+    """
+    Render many BOL PDFs in parallel and save them to storage.
+
+    Rendering is CPU-bound ReportLab work, so BOLs are snapshotted to plain
+    dicts and fanned out over a process pool; storage uploads stay in this
+    process. BOLs whose current content is already stored are not re-rendered
+    unless ``force`` is set, in which case the stored copies are replaced.
+
+    Args:
+        bol_ids: Iterable of BOL primary keys
+        max_workers: Process count (default: os.cpu_count()); 1 renders
+            serially in this process without starting a pool
+        force: Re-render every BOL and replace its stored PDF
+
+    Returns:
+        dict: {bol_id: storage URL}
+    """
+    from .models import BOL
+
+    urls = {}
+    pending = []
+    for bol in BOL.objects.for_pdf().filter(id__in=bol_ids):
+        payload = _bol_to_render_dict(bol)
+        filename = _storage_name(_namespace_from_dict(payload))
+        if not force and default_storage.exists(filename):
+            urls[bol.id] = default_storage.url(filename)
+        else:
+            pending.append((bol.id, filename, payload))
+    payloads = [payload for _, _, payload in pending]
+
+    if max_workers == 1:
+        rendered = generate_bol_pdfs(payloads, return_bytes=True)
+        for (bol_id, filename, _), pdf_bytes in zip(pending, rendered):
+            urls[bol_id] = _save_pdf_to_storage(filename, pdf_bytes, replace=force)
+        return urls
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                             initializer=_init_render_worker) as pool:
+        for (bol_id, filename, _), pdf_bytes in zip(pending, pool.map(generate_bol_pdf_from_dict, payloads)):
+            urls[bol_id] = _save_pdf_to_storage(filename, pdf_bytes, replace=force)
+    return urls
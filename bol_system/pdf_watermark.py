@@ -2,6 +2,7 @@
 PDF Watermarking for Official Weight Certification
 Adds a visible stamp to BOL PDFs when official certified scale weight is entered
 """
+from functools import lru_cache
 from io import BytesIO
 from pypdf import PdfReader, PdfWriter
 from reportlab.pdfgen import canvas
@@ -9,11 +10,18 @@ from reportlab.lib.pagesizes import landscape, letter
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
+from django.core.files.base import File
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Cached overlay pages are shared between stamping threads and pypdf resolves
+# their objects lazily through one reader. Both merge_page (which links the
+# overlay's resources into the BOL page) and add_page (which clones them into
+# the writer) read that reader, so the two run together under this lock
+_OVERLAY_LOCK = threading.Lock()
+
 
 def create_watermark_stamp(official_weight_tons, variance_tons, variance_percent):
     """
@@ -74,6 +82,12 @@ def create_watermark_stamp(official_weight_tons, variance_tons, variance_percent
     return buffer
 
 
+@lru_cache(maxsize=256)
+def _watermark_page(official_weight_tons, variance_tons, variance_percent):
+    """Parsed overlay page for a stamp; BOLs with the same figures reuse it."""
+    return PdfReader(create_watermark_stamp(official_weight_tons, variance_tons, variance_percent)).pages[0]
+
+
 def watermark_bol_pdf(bol):
     """
     Add official weight watermark to existing BOL PDF
@@ -106,50 +120,53 @@ def watermark_bol_pdf(bol):
 
         logger.info(f"Watermarking BOL {bol.bol_number}, original path: {s3_key}")
 
-        # Read original PDF from storage
-        original_pdf_file = default_storage.open(s3_key, 'rb')
-        original_pdf = PdfReader(original_pdf_file)
+        # Read original PDF from storage and release the handle (S3
+        # connection) right away; parsing happens from memory
+        with default_storage.open(s3_key, 'rb') as original_pdf_file:
+            original_pdf = PdfReader(BytesIO(original_pdf_file.read()))
 
         # Calculate variance
         variance_tons = float(bol.weight_variance_tons or 0)
         variance_percent = float(bol.weight_variance_percent or 0)
 
-        # Create watermark stamp
-        watermark_buffer = create_watermark_stamp(
+        # Create watermark stamp (parsed once per distinct set of figures)
+        watermark_page = _watermark_page(
             float(bol.official_weight_tons),
             variance_tons,
             variance_percent
         )
-        watermark_pdf = PdfReader(watermark_buffer)
 
         # Create output PDF with watermark
         writer = PdfWriter()
 
         # Overlay watermark on first page (BOL is single page)
         page = original_pdf.pages[0]
-        watermark_page = watermark_pdf.pages[0]
-        page.merge_page(watermark_page)
-        writer.add_page(page)
+        with _OVERLAY_LOCK:
+            page.merge_page(watermark_page)
+            writer.add_page(page)
 
         # Add any additional pages (shouldn't be any, but handle gracefully)
-        for i in range(1, len(original_pdf.pages)):
-            writer.add_page(original_pdf.pages[i])
+        if len(original_pdf.pages) > 1:
+            for extra_page in original_pdf.pages[1:]:
+                writer.add_page(extra_page)
 
         # Save watermarked PDF to buffer
         output_buffer = BytesIO()
         writer.write(output_buffer)
-        output_buffer.seek(0)
 
         # Generate stamped filename: bols/YYYY/BOL-NUMBER-stamped.pdf
         stamped_path = s3_key.replace('.pdf', '-stamped.pdf')
 
-        # Save to storage
-        saved_path = default_storage.save(stamped_path, ContentFile(output_buffer.read()))
+        # Source PDFs are reused while their content is unchanged, so a
+        # re-stamp (e.g. corrected official weight) must replace the old copy
+        if default_storage.exists(stamped_path):
+            default_storage.delete(stamped_path)
 
-        logger.info(f"Successfully watermarked BOL {bol.bol_number}, saved to: {saved_path}")
+        # Save to storage straight from the buffer (no second in-memory copy)
+        output_buffer.seek(0)
+        saved_path = default_storage.save(stamped_path, File(output_buffer, name=stamped_path))
 
-        # Close files
-        original_pdf_file.close()
+        logger.info(f"Successfully watermarked BOL {bol.bol_number}, saved to: {saved_path}")
 
         # Return the S3 key (path), not a signed URL
         # The serializer/view will generate signed URLs on-demand
@@ -55,8 +55,10 @@ Usage:
 
 import logging
 from functools import wraps
+from types import MappingProxyType
 
 from django.http import JsonResponse
+from django.shortcuts import render
 
 logger = logging.getLogger(__name__)
 security_logger = logging.getLogger("django.security")
@@ -64,6 +66,9 @@ security_logger = logging.getLogger("django.security")
 # Application slug used to look up permissions in JWT claims
 APP_SLUG = "primetrade"
 
+# Shared result for features the user has no permissions on
+_EMPTY_SET = frozenset()
+
 
 def has_full_access(request) -> bool:
     """
@@ -75,6 +80,16 @@ def has_full_access(request) -> bool:
     Returns:
         bool: True if user has full_access
     """
+    # Every permission check starts here; answer from the request once known
+    cached = getattr(request, "_full_access_cache", None)
+    if cached is not None:
+        return cached
+    request._full_access_cache = _session_has_full_access(request)
+    return request._full_access_cache
+
+
+def _session_has_full_access(request) -> bool:
+    """Look for the full_access wildcard in the session role data."""
     # Check session-based role data
     app_roles = request.session.get("application_roles", {})
     app_data = app_roles.get(APP_SLUG, {})
@@ -111,6 +126,23 @@ def get_feature_permissions(request):
     return app_data.get("features", {})
 
 
+def _feature_permission_sets(request) -> dict:
+    """
+    Feature permissions as frozensets, built once per request.
+
+    Views and templates may check many permissions while handling one
+    request; caching the sets on the request makes each check O(1).
+    """
+    cached = getattr(request, "_feature_perms_cache", None)
+    if cached is None:
+        cached = {
+            feature: frozenset(perms)
+            for feature, perms in get_feature_permissions(request).items()
+        }
+        request._feature_perms_cache = cached
+    return cached
+
+
 def has_permission(request, feature: str, permission: str) -> bool:
     """
     Check if user has a specific permission for a feature.
@@ -133,9 +165,7 @@ def has_permission(request, feature: str, permission: str) -> bool:
         return True
 
     # Then check specific feature permissions
-    feature_perms = get_feature_permissions(request)
-    permissions = feature_perms.get(feature, [])
-    return permission in permissions
+    return permission in _feature_permission_sets(request).get(feature, _EMPTY_SET)
 
 
 def has_any_permission(request, feature: str, permissions: list) -> bool:
@@ -158,9 +188,8 @@ def has_any_permission(request, feature: str, permissions: list) -> bool:
     if has_full_access(request):
         return True
 
-    feature_perms = get_feature_permissions(request)
-    user_perms = feature_perms.get(feature, [])
-    return any(p in user_perms for p in permissions)
+    user_perms = _feature_permission_sets(request).get(feature, _EMPTY_SET)
+    return not user_perms.isdisjoint(permissions)
 
 
 def has_all_permissions(request, feature: str, permissions: list) -> bool:
@@ -183,9 +212,8 @@ def has_all_permissions(request, feature: str, permissions: list) -> bool:
     if has_full_access(request):
         return True
 
-    feature_perms = get_feature_permissions(request)
-    user_perms = feature_perms.get(feature, [])
-    return all(p in user_perms for p in permissions)
+    user_perms = _feature_permission_sets(request).get(feature, _EMPTY_SET)
+    return user_perms.issuperset(permissions)
 
 
 def feature_permission_required(feature: str, permission: str):
@@ -226,8 +254,6 @@ def feature_permission_required(feature: str, permission: str):
                         status=403,
                     )
 
-                from django.shortcuts import render
-
                 return render(
                     request,
                     "403.html",
@@ -276,8 +302,6 @@ def any_feature_permission_required(feature: str, permissions: list):
                         status=403,
                     )
 
-                from django.shortcuts import render
-
                 return render(
                     request,
                     "403.html",
@@ -353,6 +377,15 @@ LEGACY_ROLE_PERMISSIONS = {
 }
 
 
+# Read-only copies shared by every request: tuples instead of lists, keyed by
+# the lowercase role name
+_LEGACY_ROLE_PERMISSIONS_FROZEN = {
+    role: MappingProxyType({feature: tuple(perms) for feature, perms in features.items()})
+    for role, features in LEGACY_ROLE_PERMISSIONS.items()
+}
+_EMPTY_PERMISSIONS = MappingProxyType({})
+
+
 def get_permissions_from_legacy_role(role: str) -> dict:
     """
     Get feature permissions based on legacy role.
@@ -364,9 +397,12 @@ def get_permissions_from_legacy_role(role: str) -> dict:
         role: Legacy role name (admin/office/client)
 
     Returns:
-        dict: Feature permissions derived from role
+        Mapping: Read-only feature permissions derived from role
     """
-    return LEGACY_ROLE_PERMISSIONS.get(role.lower(), {})
+    permissions = _LEGACY_ROLE_PERMISSIONS_FROZEN.get(role)
+    if permissions is None:
+        permissions = _LEGACY_ROLE_PERMISSIONS_FROZEN.get(role.lower(), _EMPTY_PERMISSIONS)
+    return permissions
 
 
 def get_effective_permissions(request) -> dict:
@@ -382,6 +418,16 @@ def get_effective_permissions(request) -> dict:
     Returns:
         dict: Effective feature permissions
     """
+    # Resolved once per request, like the full_access check
+    cached = getattr(request, "_effective_perms_cache", None)
+    if cached is not None:
+        return cached
+    request._effective_perms_cache = _resolve_effective_permissions(request)
+    return request._effective_perms_cache
+
+
+def _resolve_effective_permissions(request) -> dict:
+    """RBAC feature permissions, else those derived from the legacy role."""
     # Try RBAC permissions first
     feature_perms = get_feature_permissions(request)
     if feature_perms:
@@ -11,26 +11,65 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
-from django.http import HttpResponse
-from django.db import transaction
-from django.db.models import Q
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.db import close_old_connections, transaction
+from django.db.models import Count, Max, Prefetch, Q
 from django.utils import timezone
+from django.views.decorators.http import condition
 from decimal import Decimal, InvalidOperation
+from tempfile import SpooledTemporaryFile
 import logging
+import time
 
 from .models import (
     Tenant, Release, ReleaseLoad, BOL, Carrier, Truck,
-    Product, Lot, Customer
+    Product, Lot, Customer, submit_pdf_job_on_commit
 )
 from .services import BOLCreationService, parse_release_pdf
+from .services.pigiron_bol_pdf import generate_pigiron_bol_pdf
 from .serializers import ReleaseSerializer, ReleaseLoadSerializer
 
 logger = logging.getLogger(__name__)
 
+# Parsed release analysis keys -> Lot chemistry columns
+_ANALYSIS_LOT_FIELDS = {'C': 'c', 'Si': 'si', 'S': 's', 'P': 'p', 'Mn': 'mn'}
+
+# bol_detail ETags roll over this often; well inside the 24h signed-URL expiry
+_SIGNED_URL_ETAG_SECONDS = 3600
+
 
 def get_tenant_or_404(tenant_code):
     """Get tenant by code or return 404."""
-    return get_object_or_404(Tenant, code=tenant_code.upper(), is_active=True)
+    tenant = Tenant.get_active_by_code(tenant_code)
+    if tenant is None:
+        raise Http404(f"No active tenant '{tenant_code}'")
+    return tenant
+
+
+def _audit_identity(user):
+    """Identity recorded on audit fields: email, falling back to username."""
+    return getattr(user, 'email', '') or getattr(user, 'username', '') or ''
+
+
+def _to_positive_decimal(value):
+    """
+    Parse a weight from request data, raising ValueError unless positive.
+
+    DRF's JSONParser yields floats for fractional numbers (and ints or str
+    for the rest). Floats go through str() so 25.1 becomes Decimal('25.1')
+    rather than its binary expansion; ints and Decimals are used as-is.
+    """
+    if isinstance(value, Decimal):
+        result = value
+    elif type(value) is int:
+        result = Decimal(value)
+    else:
+        result = Decimal(str(value))
+    if result <= 0:
+        raise ValueError("Weight must be positive")
+    return result
 
 
 # =============================================================================
@@ -51,32 +90,16 @@ def release_list(request, tenant_code):
 
     status_filter = request.query_params.get('status', 'OPEN').upper()
 
-    releases = Release.objects.filter(tenant=tenant)
-
+    filters = {'tenant': tenant}
     if status_filter != 'ALL':
-        releases = releases.filter(status=status_filter)
+        filters['status'] = status_filter
 
-    releases = releases.order_by('-created_at')
+    releases = Release.list_values().filter(**filters).order_by('-created_at')
 
     data = []
-    for release in releases:
-        data.append({
-            'id': release.id,
-            'release_number': release.release_number,
-            'release_date': release.release_date,
-            'customer_id_text': release.customer_id_text,
-            'customer_po': release.customer_po,
-            'status': release.status,
-            'total_loads': release.total_loads,
-            'loads_shipped': release.loads_shipped,
-            'loads_remaining': release.loads_remaining,
-            'quantity_net_tons': release.quantity_net_tons,
-            'material_description': release.material_description,
-            'lot': release.lot,
-            'special_instructions': release.special_instructions,
-            'care_of_co': release.care_of_co,
-            'created_at': release.created_at,
-        })
+    for row in releases:
+        row['loads_remaining'] = row['total_loads'] - row['loads_shipped']
+        data.append(row)
 
     return Response({
         'tenant': tenant.code,
@@ -86,8 +109,50 @@ def release_list(request, tenant_code):
     })
 
 
+def _release_etag(request, tenant_code, release_id):
+    """
+    ETag for release_detail from the newest updated_at it depends on.
+
+    Covers the release, its loads and their BOLs, the lot and the customer;
+    the load count catches deleted loads.
+    """
+    tenant = get_tenant_or_404(tenant_code)
+    row = Release.objects.filter(id=release_id, tenant=tenant).values(
+        'updated_at', 'lot_ref__updated_at', 'customer_ref__updated_at'
+    ).annotate(
+        load_count=Count('loads', distinct=True),
+        loads_at=Max('loads__updated_at'),
+        bols_at=Max('loads__bols__updated_at'),
+        legacy_bols_at=Max('loads__bol__updated_at'),
+    ).order_by('updated_at').first()
+    if row is None:
+        return None
+    load_count = row.pop('load_count')
+    newest = max(value for value in row.values() if value is not None)
+    return f"release-{release_id}-{load_count}-{newest:%Y%m%d%H%M%S%f}"
+
+
+def _active_bol_info(load):
+    """Summary of a load's non-void BOL, or None if it has not shipped."""
+    # Check new release_line FK first, then legacy bol FK
+    active_bol = load.active_bols[0] if load.active_bols else None
+    if not active_bol and load.bol:
+        active_bol = load.bol if not load.bol.is_void else None
+
+    if not active_bol:
+        return None
+    return {
+        'id': active_bol.id,
+        'bol_number': active_bol.bol_number,
+        'bol_date': active_bol.bol_date or active_bol.date,
+        'net_tons': active_bol.net_tons,
+        'carrier_name': active_bol.carrier_name,
+    }
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@condition(etag_func=_release_etag)
 def release_detail(request, tenant_code, release_id):
     """
     Get release details with all loads.
@@ -95,26 +160,24 @@ def release_detail(request, tenant_code, release_id):
     GET /tenant/{tenant_code}/pigiron/releases/{release_id}/
     """
     tenant = get_tenant_or_404(tenant_code)
-    release = get_object_or_404(Release, id=release_id, tenant=tenant)
-
-    loads = []
-    for load in release.loads.all():
-        bol_info = None
-        # Check new release_line FK first, then legacy bol FK
-        active_bol = load.bols.filter(is_void=False).first()
-        if not active_bol and load.bol:
-            active_bol = load.bol if not load.bol.is_void else None
-
-        if active_bol:
-            bol_info = {
-                'id': active_bol.id,
-                'bol_number': active_bol.bol_number,
-                'bol_date': active_bol.bol_date or active_bol.date,
-                'net_tons': active_bol.net_tons,
-                'carrier_name': active_bol.carrier_name,
-            }
+    # Loads, their active BOLs and the legacy BOL come back in three queries
+    # instead of one or two per load
+    active_bols = BOL.objects.filter(is_void=False)
+    release = get_object_or_404(
+        Release.objects.select_related('lot_ref', 'customer_ref').prefetch_related(
+            Prefetch(
+                'loads',
+                queryset=ReleaseLoad.objects.select_related('bol').prefetch_related(
+                    Prefetch('bols', queryset=active_bols, to_attr='active_bols')
+                ),
+            )
+        ),
+        id=release_id,
+        tenant=tenant,
+    )
 
-        loads.append({
+    loads = [
+        {
             'id': load.id,
             'seq': load.seq,
             'line_number': load.line_number,
@@ -122,8 +185,10 @@ def release_detail(request, tenant_code, release_id):
             'planned_tons': load.planned_tons,
             'status': load.status,
             'shipped_at': load.shipped_at,
-            'bol': bol_info,
-        })
+            'bol': _active_bol_info(load),
+        }
+        for load in release.loads.all()
+    ]
 
     # Get lot chemistry if available
     lot_info = None
@@ -190,8 +255,8 @@ def upload_release(request, tenant_code):
         parsed_data = parse_release_pdf(pdf_file)
 
         logger.info(
-            f"Parsed release {parsed_data.get('releaseNumber', 'UNKNOWN')} "
-            f"for tenant {tenant.code}"
+            "Parsed release %s for tenant %s",
+            parsed_data.get('releaseNumber', 'UNKNOWN'), tenant.code
         )
 
         return Response({
@@ -200,13 +265,13 @@ def upload_release(request, tenant_code):
         })
 
     except ImportError as e:
-        logger.error(f"Release parsing dependency error: {e}")
+        logger.error("Release parsing dependency error: %s", e)
         return Response(
             {'error': 'Release parsing service unavailable'},
             status=status.HTTP_503_SERVICE_UNAVAILABLE
         )
     except Exception as e:
-        logger.error(f"Release parsing error: {e}")
+        logger.error("Release parsing error: %s", e)
         return Response(
             {'error': f'Failed to parse release: {str(e)}'},
             status=status.HTTP_400_BAD_REQUEST
@@ -234,30 +299,21 @@ def approve_release(request, tenant_code):
 
             if lot_code:
                 analysis = material.get('analysis', {})
+                chemistry = {
+                    field: analysis[key]
+                    for key, field in _ANALYSIS_LOT_FIELDS.items()
+                    if analysis.get(key) is not None
+                }
                 lot, created = Lot.objects.get_or_create(
                     tenant=tenant,
                     code=lot_code,
-                    defaults={
-                        'c': analysis.get('C'),
-                        'si': analysis.get('Si'),
-                        's': analysis.get('S'),
-                        'p': analysis.get('P'),
-                        'mn': analysis.get('Mn'),
-                    }
+                    defaults=chemistry,
                 )
-                if not created and any(analysis.values()):
-                    # Update chemistry if provided
-                    if analysis.get('C') is not None:
-                        lot.c = analysis['C']
-                    if analysis.get('Si') is not None:
-                        lot.si = analysis['Si']
-                    if analysis.get('S') is not None:
-                        lot.s = analysis['S']
-                    if analysis.get('P') is not None:
-                        lot.p = analysis['P']
-                    if analysis.get('Mn') is not None:
-                        lot.mn = analysis['Mn']
-                    lot.save()
+                if not created and chemistry:
+                    # Update chemistry if provided, writing only those columns
+                    for field, value in chemistry.items():
+                        setattr(lot, field, value)
+                    lot.save(update_fields=[*chemistry, 'updated_at'])
 
             # Create release
             ship_to = data.get('shipTo', {})
@@ -284,19 +340,19 @@ def approve_release(request, tenant_code):
 
             # Create release loads from schedule
             schedule = data.get('schedule', [])
-            for item in schedule:
-                ReleaseLoad.objects.create(
-                    tenant=tenant,
-                    release=release,
-                    seq=item.get('load', 1),
-                    date=item.get('date'),
-                    planned_tons=data.get('quantityNetTons'),  # Default to total
-                    status='PENDING',
-                )
+            ReleaseLoad.create_for_release(
+                release,
+                len(schedule),
+                planned_tons=data.get('quantityNetTons'),  # Default to total
+                dates=[item.get('date') for item in schedule],
+                seqs=[item.get('load') for item in schedule],
+                tenant=tenant,
+                status='PENDING',
+            )
 
             logger.info(
-                f"Created release {release.release_number} with {len(schedule)} loads "
-                f"for tenant {tenant.code}"
+                "Created release %s with %d loads for tenant %s",
+                release.release_number, len(schedule), tenant.code
             )
 
             return Response({
@@ -307,7 +363,7 @@ def approve_release(request, tenant_code):
             }, status=status.HTTP_201_CREATED)
 
     except Exception as e:
-        logger.error(f"Release approval error: {e}")
+        logger.error("Release approval error: %s", e)
         return Response(
             {'error': f'Failed to create release: {str(e)}'},
             status=status.HTTP_400_BAD_REQUEST
@@ -328,10 +384,19 @@ def pending_loads(request, tenant_code):
     """
     tenant = get_tenant_or_404(tenant_code)
 
+    # Only the columns serialized below; pending queues can be long
     loads = ReleaseLoad.objects.filter(
         tenant=tenant,
         status='PENDING'
-    ).select_related('release', 'release__lot_ref').order_by('date', 'release__release_number', 'seq')
+    ).select_related('release', 'release__lot_ref').only(
+        'id', 'seq', 'date', 'planned_tons',
+        'release__id', 'release__release_number', 'release__customer_id_text',
+        'release__customer_po', 'release__ship_to_name', 'release__ship_to_city',
+        'release__ship_to_state', 'release__material_description', 'release__lot',
+        'release__special_instructions', 'release__care_of_co',
+        'release__lot_ref__code', 'release__lot_ref__c', 'release__lot_ref__si',
+        'release__lot_ref__s', 'release__lot_ref__p', 'release__lot_ref__mn',
+    ).order_by('date', 'release__release_number', 'seq')
 
     data = []
     for load in loads:
@@ -407,9 +472,7 @@ def create_bol(request, tenant_code):
             truck = get_object_or_404(Truck, id=data['truck_id'])
 
         try:
-            net_tons = Decimal(str(data['net_tons']))
-            if net_tons <= 0:
-                raise ValueError("Weight must be positive")
+            net_tons = _to_positive_decimal(data['net_tons'])
         except (InvalidOperation, ValueError) as e:
             return Response(
                 {'error': f'Invalid net_tons: {e}'},
@@ -417,7 +480,7 @@ def create_bol(request, tenant_code):
             )
 
         # Get user email for audit
-        issued_by = getattr(request.user, 'email', '') or getattr(request.user, 'username', '')
+        issued_by = _audit_identity(request.user)
 
         # Create BOL using service
         bol = BOLCreationService.create_bol(
@@ -428,7 +491,10 @@ def create_bol(request, tenant_code):
             issued_by=issued_by,
         )
 
-        logger.info(f"Created BOL {bol.bol_number} for tenant {tenant.code} by {issued_by}")
+        logger.info("Created BOL %s for tenant %s by %s", bol.bol_number, tenant.code, issued_by)
+
+        # Render the PDF off the request path once the BOL is committed
+        submit_pdf_job_on_commit(_warm_bol_pdf_cache, bol.id)
 
         return Response({
             'status': 'created',
@@ -451,15 +517,33 @@ def create_bol(request, tenant_code):
             status=status.HTTP_400_BAD_REQUEST
         )
     except Exception as e:
-        logger.error(f"BOL creation error: {e}")
+        logger.error("BOL creation error: %s", e)
         return Response(
             {'error': f'Failed to create BOL: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
+def _bol_etag(request, tenant_code, bol_id):
+    """
+    ETag for bol_detail from the BOL's updated_at.
+
+    The response carries a signed pdf_url, so the tag also rolls over every
+    _SIGNED_URL_ETAG_SECONDS to keep revalidated copies from outliving it.
+    """
+    tenant = get_tenant_or_404(tenant_code)
+    updated_at = BOL.objects.filter(id=bol_id, tenant=tenant).values_list(
+        'updated_at', flat=True
+    ).first()
+    if updated_at is None:
+        return None
+    url_bucket = int(time.time() // _SIGNED_URL_ETAG_SECONDS)
+    return f"bol-{bol_id}-{updated_at:%Y%m%d%H%M%S%f}-{url_bucket}"
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@condition(etag_func=_bol_etag)
 def bol_detail(request, tenant_code, bol_id):
     """
     Get BOL details.
@@ -539,12 +623,12 @@ def void_bol(request, tenant_code, bol_id):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    voided_by = getattr(request.user, 'email', '') or getattr(request.user, 'username', '')
+    voided_by = _audit_identity(request.user)
 
     try:
         bol = BOLCreationService.void_bol(bol, voided_by, reason)
 
-        logger.info(f"Voided BOL {bol.bol_number} for tenant {tenant.code} by {voided_by}")
+        logger.info("Voided BOL %s for tenant %s by %s", bol.bol_number, tenant.code, voided_by)
 
         return Response({
             'status': 'voided',
@@ -586,23 +670,21 @@ def set_official_weight(request, tenant_code, bol_id):
         )
 
     try:
-        weight_tons = Decimal(str(weight_tons))
-        if weight_tons <= 0:
-            raise ValueError("Weight must be positive")
+        weight_tons = _to_positive_decimal(weight_tons)
     except (InvalidOperation, ValueError) as e:
         return Response(
             {'error': f'Invalid weight_tons: {e}'},
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    entered_by = getattr(request.user, 'email', '') or getattr(request.user, 'username', '')
+    entered_by = _audit_identity(request.user)
 
     try:
         BOLCreationService.update_official_weight(bol, weight_tons, entered_by)
 
         logger.info(
-            f"Set official weight {weight_tons} tons on BOL {bol.bol_number} "
-            f"for tenant {tenant.code} by {entered_by}"
+            "Set official weight %s tons on BOL %s for tenant %s by %s",
+            weight_tons, bol.bol_number, tenant.code, entered_by
         )
 
         return Response({
@@ -614,13 +696,59 @@ def set_official_weight(request, tenant_code, bol_id):
         })
 
     except Exception as e:
-        logger.error(f"Official weight error: {e}")
+        logger.error("Official weight error: %s", e)
         return Response(
             {'error': f'Failed to set official weight: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
+def _bol_pdf_cache_key(bol):
+    """Storage key for a rendered BOL PDF; changes whenever the BOL is saved."""
+    return f"bol_pdf/{bol.tenant_id}/{bol.id}/{bol.updated_at:%Y%m%d%H%M%S%f}.pdf"
+
+
+def _store_bol_pdf(bol, buffer):
+    """
+    Save a rendered PDF under the BOL's cache key unless already there.
+
+    Only the current key is kept: renders cached under earlier updated_at
+    stamps can no longer be served, so they are deleted once the new one is
+    stored.
+    """
+    cache_key = _bol_pdf_cache_key(bol)
+    try:
+        if not default_storage.exists(cache_key):
+            buffer.seek(0)
+            default_storage.save(cache_key, File(buffer, name=cache_key))
+            _prune_bol_pdfs(cache_key)
+    except Exception as e:
+        # A cache miss next time is fine; don't fail the caller over it
+        logger.warning("Could not cache PDF for BOL %s: %s", bol.bol_number, e)
+
+
+def _prune_bol_pdfs(cache_key):
+    """Delete the BOL's other cached PDFs in the directory holding ``cache_key``."""
+    directory, current = cache_key.rsplit('/', 1)
+    _, files = default_storage.listdir(directory)
+    for name in files:
+        if name != current:
+            default_storage.delete(f"{directory}/{name}")
+
+
+def _warm_bol_pdf_cache(bol_id):
+    """Render a new BOL's PDF into storage so the first download is a hit."""
+    try:
+        bol = BOL.objects.get(pk=bol_id)
+        with SpooledTemporaryFile(max_size=1 << 20) as buffer:
+            generate_pigiron_bol_pdf(bol, stream=buffer)
+            _store_bol_pdf(bol, buffer)
+    except Exception as e:
+        logger.error("Background PDF render failed for BOL id %s: %s", bol_id, e, exc_info=True)
+    finally:
+        close_old_connections()
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def bol_pdf(request, tenant_code, bol_id):
@@ -628,27 +756,49 @@ def bol_pdf(request, tenant_code, bol_id):
     Generate/download BOL PDF.
 
     GET /tenant/{tenant_code}/pigiron/bol/{bol_id}/pdf/
+
+    Rendered PDFs are kept in storage keyed on the BOL's updated_at, so
+    repeat views stream the stored copy and conditional requests get a 304.
     """
     tenant = get_tenant_or_404(tenant_code)
     bol = get_object_or_404(BOL, id=bol_id, tenant=tenant)
 
-    # Import PDF generator
-    from .services.pigiron_bol_pdf import generate_pigiron_bol_pdf
-
-    try:
-        pdf_bytes = generate_pigiron_bol_pdf(bol)
+    cache_key = _bol_pdf_cache_key(bol)
+    etag = f'"{cache_key.rsplit("/", 1)[-1][:-4]}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponseNotModified()
+        response['ETag'] = etag
+        return response
 
-        response = HttpResponse(pdf_bytes, content_type='application/pdf')
-        response['Content-Disposition'] = f'inline; filename="{bol.bol_number}.pdf"'
+    if default_storage.exists(cache_key):
+        response = FileResponse(
+            default_storage.open(cache_key, 'rb'),
+            content_type='application/pdf', filename=f'{bol.bol_number}.pdf'
+        )
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
         return response
 
+    # Render into a spooled file (in memory up to 1 MB, then on disk) and
+    # stream it out rather than holding the whole PDF as bytes
+    buffer = SpooledTemporaryFile(max_size=1 << 20)
+    try:
+        generate_pigiron_bol_pdf(bol, stream=buffer)
     except Exception as e:
-        logger.error(f"PDF generation error for BOL {bol.bol_number}: {e}")
+        buffer.close()
+        logger.error("PDF generation error for BOL %s: %s", bol.bol_number, e)
         return Response(
             {'error': f'Failed to generate PDF: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+    _store_bol_pdf(bol, buffer)
+    buffer.seek(0)
+    response = FileResponse(buffer, content_type='application/pdf', filename=f'{bol.bol_number}.pdf')
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
 
 # =============================================================================
 # Inventory Views
@@ -664,25 +814,26 @@ def inventory_report(request, tenant_code):
     """
     tenant = get_tenant_or_404(tenant_code)
 
-    products = Product.objects.filter(tenant=tenant, is_active=True)
+    products = Product.objects.filter(tenant=tenant, is_active=True).tonnage_values(
+        'id', 'name', 'start_tons', 'last_lot_code'
+    )
 
+    # Totals are accumulated while building rows (every row is returned, so a
+    # separate SQL aggregate would only add a query)
     data = []
-    for product in products:
-        data.append({
-            'id': product.id,
-            'name': product.name,
-            'start_tons': product.start_tons,
-            'shipped_tons': product.shipped_tons,
-            'remaining_tons': product.remaining_tons,
-            'last_lot_code': product.last_lot_code,
-        })
+    total_start = total_shipped = 0
+    for row in products:
+        row['remaining_tons'] = row['start_tons'] - row['shipped_tons']
+        total_start += row['start_tons']
+        total_shipped += row['shipped_tons']
+        data.append(row)
 
     return Response({
         'tenant': tenant.code,
         'products': data,
-        'total_start_tons': sum(p['start_tons'] for p in data),
-        'total_shipped_tons': sum(p['shipped_tons'] for p in data),
-        'total_remaining_tons': sum(p['remaining_tons'] for p in data),
+        'total_start_tons': total_start,
+        'total_shipped_tons': total_shipped,
+        'total_remaining_tons': total_start - total_shipped,
     })
 
 
@@ -696,24 +847,14 @@ def product_list(request, tenant_code):
     """
     tenant = get_tenant_or_404(tenant_code)
 
-    products = Product.objects.filter(tenant=tenant).order_by('name')
+    products = Product.objects.filter(tenant=tenant).order_by('name').tonnage_values(
+        'id', 'name', 'start_tons', 'is_active', 'last_lot_code', 'c', 'si', 's', 'p', 'mn'
+    )
 
     data = []
-    for product in products:
-        data.append({
-            'id': product.id,
-            'name': product.name,
-            'start_tons': product.start_tons,
-            'shipped_tons': product.shipped_tons,
-            'remaining_tons': product.remaining_tons,
-            'is_active': product.is_active,
-            'last_lot_code': product.last_lot_code,
-            'c': product.c,
-            'si': product.si,
-            's': product.s,
-            'p': product.p,
-            'mn': product.mn,
-        })
+    for row in products:
+        row['remaining_tons'] = row['start_tons'] - row['shipped_tons']
+        data.append(row)
 
     return Response({
         'tenant': tenant.code,
@@ -734,9 +875,8 @@ def lot_list(request, tenant_code):
 
     lots = Lot.objects.filter(tenant=tenant).select_related('product').order_by('-created_at')
 
-    data = []
-    for lot in lots:
-        data.append({
+    data = [
+        {
             'id': lot.id,
             'code': lot.code,
             'product_id': lot.product_id,
@@ -748,7 +888,9 @@ def lot_list(request, tenant_code):
             'p': lot.p,
             'mn': lot.mn,
             'created_at': lot.created_at,
-        })
+        }
+        for lot in lots
+    ]
 
     return Response({
         'tenant': tenant.code,
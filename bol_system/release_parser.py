@@ -1,4 +1,7 @@
+import hashlib
 import re
+import threading
+from io import BytesIO
 from typing import Any, Dict, List
 
 from pypdf import PdfReader
@@ -11,22 +14,130 @@ from .ai_parser import (
 
 DATE_SLASH = r"\d{2}/\d{2}/\d{4}"
 DATE_DASH = r"\d{2}-\d{2}-\d{2}"
+# Schedule dates come as either 11-05-25 or 11/04/25
+DATE_SHORT = r"\d{2}[-/]\d{2}[-/]\d{2}"
 
+# Patterns are compiled once at import; parse_release_text runs ~60 searches
+# per document. Unless noted, label patterns are case-insensitive.
 
-def _find(pattern: str, text: str, flags: int = re.IGNORECASE) -> str | None:
-    m = re.search(pattern, text, flags)
+# Ship-to address splitting
+_RE_STREET_SUFFIX = re.compile(
+    # Note: No trailing \b because "St." followed by comma doesn't have a word boundary after the period
+    r'\b(St\.?|Street|Ave\.?|Avenue|Rd\.?|Road|Dr\.?|Drive|Blvd\.?|Boulevard|Ln\.?|Lane|Way|Ct\.?|Court|Pl\.?|Place|Hwy\.?|Highway|Pike|Circle|Cir\.?)',
+    re.I,
+)
+_RE_LEADING_PUNCT = re.compile(r'^[,.\s]+')
+_RE_CITY_STATE_ZIP = re.compile(r'^([A-Za-z ]+?),?\s*([A-Z]{2})\s+(\d{5})')
+_RE_LAST_LINE_STATE_ZIP = re.compile(r'^([A-Za-z ]+)?\s*([A-Z]{2})\s+(\d{5})$')
+
+# Header fields
+_RE_RELEASE_NO = re.compile(r"Release\s*#\s*[:\-]?\s*(\d+)", re.I)
+_RE_RELEASE_DATE = re.compile(r"Release\s*Date\s*[:\-]?\s*(%s)" % DATE_SLASH, re.I)
+_RE_DATE = re.compile(r"Date\s*[:\-]?\s*(%s)" % DATE_SLASH, re.I)
+_RE_CUSTOMER_ID = re.compile(r"Customer\s*(?:ID|Name)?\s*[:\-]?\s*([A-Za-z0-9 .,&'\-/]+)", re.I)
+_RE_CUSTOMER_COLON = re.compile(r"Customer\s*:\s*([A-Za-z0-9 .,&'\-/]+)", re.I)
+# Case-sensitive: data rows, not labels
+_RE_CARRIER_ROW_WITH_RELEASE = re.compile(
+    r"\d{2}/\d{2}/\d{4}\s+\d+\s+([A-Za-z][A-Za-z0-9 ]+?)\s+(?:Origin|Destination)\b"
+)
+_RE_CARRIER_ROW = re.compile(
+    r"\d{2}/\d{2}/\d{4}\s+([A-Za-z][A-Za-z0-9 ]+?)\s+(?:Origin|Destination)\b"
+)
+_RE_SHIP_VIA = re.compile(r"Ship\s*Via\s*[:\-]?\s*([^\n]+?)(?:\s+FOB|\n)", re.I)
+_RE_FOB_BEFORE_PO = re.compile(r"FOB\s*[:\-]?\s*([^\n]+?)(?:\s+Customer\s*P\.?O\.?|\n)", re.I)
+_RE_FOB = re.compile(r"FOB\s*[:\-]?\s*([^\n]+)", re.I)
+_RE_CUSTOMER_PO = re.compile(r"Customer\s*P\.?O\.?\s*(?:#\s*)?[:\-]?\s*(\S+)", re.I)
+
+# Header row with values on the next line
+_RE_HEADER_ROW = re.compile(
+    r"^\s*Release\s*Date\s+Ship\s*Via\s+FOB\s+Customer\s*P\.?O\.?\s*#\s*$\n([^\n]+)", re.I | re.M
+)
+_RE_DATE_SLASH = re.compile(DATE_SLASH)
+_RE_FOB_TERM = re.compile(r"\b(Origin|Destination)\b", re.I)
+_RE_PO_DIGITS = re.compile(r"(\d{4,})(?=\D|$)")
+_RE_MULTI_SPACE = re.compile(r"\s{2,}")
+_RE_TRAILING_RELEASE_NO = re.compile(r"\bRelease\s*#:?.*$", re.I)
+
+# Customer ID / Ship To
+_RE_CUSTOMER_ID_INLINE = re.compile(r"Customer\s*ID\s*:\s*([^\n\r]+)", re.I)
+_RE_SHIP_TO_WINDOW = re.compile(r"Ship To:[\s\S]{0,400}", re.I)
+_RE_ZIP_CUSTOMER_TOKEN = re.compile(r"\b\d{5}\s*([A-Z][A-Z .,&'\-]{3,})\b")
+_RE_ZIP_CUSTOMER_TOKEN_SHORT = re.compile(r"\b\d{5}\s*([A-Z][A-Z .,&'\-]{2,})")
+_RE_SHIP_TO_BLOCK = re.compile(
+    r"Ship To:\s*([\s\S]*?)(?:\n\s*(?:Release\s*#|Release\s*Date|Approx\.|Please\s+deliver|Shipper:))", re.I
+)
+_RE_COLUMN_GAP = re.compile(r'\s{5,}')
+_RE_ZIP_TRAILING_TOKEN = re.compile(r"(\b\d{5})(?:\s*[A-Z][A-Z .,&'\-]{1,})?$")
+_RE_ADDRESS_NOISE = re.compile(r"Release\s*Date|^\s*\d{2}/\d{2}/\d{4}|Release\s*#", re.I)
+_RE_ADDRESS_STOP = re.compile(
+    r"^(Release\s*#|Shipper:|Please\s+deliver|Charlotte,\s*NC|^\d{2}/\d{2}/\d{4})", re.I
+)
+_RE_CITY_COMMA_STATE_ZIP = re.compile(r"[A-Za-z]+,\s*[A-Z]{2}\s+\d{5}")
+
+# Material and quantity
+_RE_LOT_CRT = re.compile(r"\b(CRT\s+[A-Za-z0-9-]+)\s+NT\b", re.I)
+_RE_LOT_NODULAR = re.compile(r"\b([A-Z]{3}\s*\S+)\s+NODULAR PIG IRON", re.I)
+_RE_LOT_NUMBER = re.compile(r"Lot\s*Number\s*\n([\S ]+)", re.I)
+_RE_NODULAR = re.compile(r"NODULAR\s+PIG\s+IRON", re.I)
+_RE_QTY_APPROX = re.compile(r"Approx\.?\s*Quantity[\s\S]{0,200}?(\d+\.\d{3})", re.I)
+_RE_QTY_CRT_LINE = re.compile(r"(?mi)^\s*(\d+\.\d{3})\s+CRT\b", re.I)
+_RE_QTY_NT = re.compile(r"(\d+\.\d{3})[\s\S]{0,40}?\bNT\b", re.I)
+
+# Chemistry, all elements in one pass: groups 1-2 are the analysis line
+# (C 4.25), groups 3-4 the microelements, which also come as "CR .004"
+_RE_ELEMENT = re.compile(
+    r"\b(?:(C|Si|S|P|Mn)\s*(\d+\.\d+)|(CR|TI|V)\s*\.?(\d+(?:\.\d+)?))", re.I
+)
+# (output key, upper-cased element token)
+_ANALYSIS_ELEMENTS = (("C", "C"), ("Si", "SI"), ("S", "S"), ("P", "P"), ("Mn", "MN"))
+_EXTRA_ELEMENTS = (("Cr", "CR"), ("Ti", "TI"), ("V", "V"))
+_ELEMENT_COUNT = len(_ANALYSIS_ELEMENTS) + len(_EXTRA_ELEMENTS)
+
+# Warehouse
+_RE_WAREHOUSE_CODE = re.compile(r"Warehouse\s*\n\s*([A-Z]{3})", re.I)
+_RE_WAREHOUSE_CRT = re.compile(r"\bWarehouse\b[\s\S]*?\b(CRT)\b", re.I)
+_RE_CINCINNATI = re.compile(r"\bCINCINNATI\b", re.I)
+
+# Schedule lines; "Deliver/Pickup" is optional for formats like "1 TL 11/04/25 LOAD #1"
+_RE_SCHEDULE = re.compile(
+    r"(?:\d+\s*TL\s*)?(?:(?:Deliver|Pickup)\s*)?(%s)\s*(?:LOAD|Load)\s*#?\s*(\d+)" % DATE_SHORT, re.I
+)
+_RE_DATE_SEP = re.compile(r'[-/]')
+
+# Warehouse / BOL requirements
+_RE_WAREHOUSE_SECTION = re.compile(
+    r"Warehouse\s*(?:requirements)?\s*:\s*([\s\S]*?)(?=\n\s*(?:Trucking\s*(?:requirements)?\s*:|SPECIAL\s+INSTRUCTIONS\s*:|Ship\s+From\s*:)|$)",
+    re.I,
+)
+_RE_WAREHOUSE_REQUIREMENTS = re.compile(
+    r"Warehouse\s+requirements\s*:\s*([\s\S]*?)(?:\n\s*(Trucking\s+requirements|Please\s+deliver|$))", re.I
+)
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_RADIOACTIVE_STATEMENT = re.compile(r"Put this statement on BOL:.*free of radioactive contamination", re.I)
+# Fallback phrases when the requirements section can't be parsed
+_RE_BOL_REQUIREMENT_PHRASES = [
+    re.compile(phrase, re.I | re.S)
+    for phrase in [
+        r"Put this statement on BOL:.*free of radioactive contamination",
+        r"free of radioactive contamination",
+        r"Analysis\s*&\s*PO must be on BOL",
+        r"SEND TO THE FOUNDRY",
+        r"Do\s*NOT\s*exceed\s*max(imum)?\s*legal",
+        r"Trucks?\s+must\s+be\s+TARPED",
+        r"Material\s*#\s*\S+",
+        r"P\.O\.\s*#\s*\S+",
+        r"SHIPPER:\s*Primetrade,?\s*LLC",
+    ]
+]
+
+
+def _find(pattern: re.Pattern, text: str) -> str | None:
+    m = pattern.search(text)
     if not m:
         return None
-    # If the regex has a capturing group, return it; otherwise return the full match
-    try:
-        # m.re.groups is the number of capturing groups in the pattern
-        if getattr(m, 're', None) and getattr(m.re, 'groups', 0) >= 1:
-            return m.group(1).strip()
-        # Fallback to full match when no capturing group present
-        return m.group(0).strip()
-    except Exception:
-        # Absolute fallback – never raise for missing group
-        return m.group(0).strip()
+    # If the regex has a capturing group, return it; otherwise return the full match.
+    # Every capturing pattern passed here always sets group 1 on a match.
+    return m.group(1 if pattern.groups else 0).strip()
 
 
 def _parse_shipto_address(addr: str | None) -> Dict[str, str]:
@@ -38,16 +149,14 @@ def _parse_shipto_address(addr: str | None) -> Dict[str, str]:
 
     # First, try to handle "Street City, ST ZIP" format (no comma between street and city)
     # Look for common street suffixes to find where street ends
-    # Note: No trailing \b because "St." followed by comma doesn't have a word boundary after the period
-    street_suffixes = r'\b(St\.?|Street|Ave\.?|Avenue|Rd\.?|Road|Dr\.?|Drive|Blvd\.?|Boulevard|Ln\.?|Lane|Way|Ct\.?|Court|Pl\.?|Place|Hwy\.?|Highway|Pike|Circle|Cir\.?)'
-    suffix_match = re.search(street_suffixes, addr, re.I)
+    suffix_match = _RE_STREET_SUFFIX.search(addr)
     if suffix_match:
         street = addr[:suffix_match.end()].strip()
         remainder = addr[suffix_match.end():].strip()
         # Remove leading punctuation/whitespace from remainder
-        remainder = re.sub(r'^[,.\s]+', '', remainder).strip()
+        remainder = _RE_LEADING_PUNCT.sub('', remainder).strip()
         # remainder should be "City, ST ZIP" or "City ST ZIP"
-        city_match = re.match(r'^([A-Za-z ]+?),?\s*([A-Z]{2})\s+(\d{5})', remainder)
+        city_match = _RE_CITY_STATE_ZIP.match(remainder)
         if city_match:
             parsed['street'] = street
             parsed['city'] = city_match.group(1).strip()
@@ -64,7 +173,7 @@ def _parse_shipto_address(addr: str | None) -> Dict[str, str]:
     if lines:
         last = lines[-1].strip()
         # Try to extract State ZIP from last line (e.g., "Rushville, IN 46173" or "IN 46173")
-        m = re.match(r'^([A-Za-z ]+)?\s*([A-Z]{2})\s+(\d{5})$', last)
+        m = _RE_LAST_LINE_STATE_ZIP.match(last)
         if m:
             city_from_last, state, zip_code = m.groups()
             parsed['state'] = state
@@ -95,19 +204,19 @@ def parse_release_text(text: str) -> Dict[str, Any]:
     The parser is rule/regex-based and tuned for the provided examples.
     """
     # Normalize spaces
-    t = re.sub(r"\u00a0", " ", text)
+    t = text.replace("\u00a0", " ")
 
     # Header fields
-    release_no = _find(r"Release\s*#\s*[:\-]?\s*(\d+)", t)
+    release_no = _find(_RE_RELEASE_NO, t)
     # Allow optional colon and flexible spacing
     release_date = (
-        _find(r"Release\s*Date\s*[:\-]?\s*(%s)" % DATE_SLASH, t)
-        or _find(r"Date\s*[:\-]?\s*(%s)" % DATE_SLASH, t)
+        _find(_RE_RELEASE_DATE, t)
+        or _find(_RE_DATE, t)
     )
     # Customer name/ID variations
     customer_id = (
-        _find(r"Customer\s*(?:ID|Name)?\s*[:\-]?\s*([A-Za-z0-9 .,&'\-/]+)", t)
-        or _find(r"Customer\s*:\s*([A-Za-z0-9 .,&'\-/]+)", t)
+        _find(_RE_CUSTOMER_ID, t)
+        or _find(_RE_CUSTOMER_COLON, t)
     )
 
     # Ship Via and FOB - allow colon and line ends
@@ -117,42 +226,36 @@ def parse_release_text(text: str) -> Dict[str, Any]:
     # Pattern 2: date + release# + carrier + FOB term (e.g., "01/09/2026    60381    US Bulk    Destination")
     carrier_data_row = (
         # Pattern: date + release# + carrier + FOB term
-        re.search(
-            r"\d{2}/\d{2}/\d{4}\s+\d+\s+([A-Za-z][A-Za-z0-9 ]+?)\s+(?:Origin|Destination)\b",
-            t
-        )
+        _RE_CARRIER_ROW_WITH_RELEASE.search(t)
         # Pattern: date + carrier + FOB term (no release# in between)
-        or re.search(
-            r"\d{2}/\d{2}/\d{4}\s+([A-Za-z][A-Za-z0-9 ]+?)\s+(?:Origin|Destination)\b",
-            t
-        )
+        or _RE_CARRIER_ROW.search(t)
     )
     if carrier_data_row:
         ship_via = carrier_data_row.group(1).strip()
     else:
         ship_via = (
-            _find(r"Ship\s*Via\s*[:\-]?\s*([^\n]+?)(?:\s+FOB|\n)", t)
+            _find(_RE_SHIP_VIA, t)
         )
     fob = (
-        _find(r"FOB\s*[:\-]?\s*([^\n]+?)(?:\s+Customer\s*P\.?O\.?|\n)", t)
-        or _find(r"FOB\s*[:\-]?\s*([^\n]+)", t)
+        _find(_RE_FOB_BEFORE_PO, t)
+        or _find(_RE_FOB, t)
     )
     # Customer PO variants: PO, P.O., with/without '#'
-    customer_po = _find(r"Customer\s*P\.?O\.?\s*(?:#\s*)?[:\-]?\s*(\S+)", t)
+    customer_po = _find(_RE_CUSTOMER_PO, t)
 
     # Fallback: header row with values on next line
-    hdr = re.search(r"^\s*Release\s*Date\s+Ship\s*Via\s+FOB\s+Customer\s*P\.?O\.?\s*#\s*$\n([^\n]+)", t, re.I | re.M)
+    hdr = _RE_HEADER_ROW.search(t)
     if hdr:
         row = hdr.group(1).strip()
         # 1) Date
-        dm = re.search(DATE_SLASH, row)
+        dm = _RE_DATE_SLASH.search(row)
         if dm:
             release_date = dm.group(0)
             rest = row[dm.end():].strip()
         else:
             rest = row
         # 2) FOB token and Ship Via (text between date and FOB)
-        fob_m = re.search(r"\b(Origin|Destination)\b", rest, re.I)
+        fob_m = _RE_FOB_TERM.search(rest)
         if fob_m:
             fob = fob_m.group(1).title()
             pre = rest[:fob_m.start()].strip()
@@ -162,32 +265,32 @@ def parse_release_text(text: str) -> Dict[str, Any]:
         else:
             rest_after_fob = rest
         # 3) Customer PO (digits, even when glued to next word)
-        po_m = re.search(r"(\d{4,})(?=\D|$)", rest_after_fob)
+        po_m = _RE_PO_DIGITS.search(rest_after_fob)
         if po_m:
             customer_po = po_m.group(1)
             name_after = rest_after_fob[po_m.end():].lstrip(" -:#")
         else:
             name_after = rest_after_fob
         # 4) Ship-To name from the remainder (first words; stop at obvious noise)
-        ship_to_name = re.sub(r"\s{2,}", " ", name_after).strip()
-        ship_to_name = re.sub(r"\bRelease\s*#:?.*$", "", ship_to_name, flags=re.I)
+        ship_to_name = _RE_MULTI_SPACE.sub(" ", name_after).strip()
+        ship_to_name = _RE_TRAILING_RELEASE_NO.sub("", ship_to_name)
 
     # Customer ID fallback near label
     if not customer_id:
-        cid_inline = re.search(r"Customer\s*ID\s*:\s*([^\n\r]+)", t, re.I)
+        cid_inline = _RE_CUSTOMER_ID_INLINE.search(t)
         if cid_inline and cid_inline.group(1).strip():
             customer_id = cid_inline.group(1).strip()
         else:
             # Look for an all-caps token appearing after a ZIP code in the Ship-To area
-            ship_block_for_id = re.search(r"Ship To:[\s\S]{0,400}", t, re.I)
+            ship_block_for_id = _RE_SHIP_TO_WINDOW.search(t)
             if ship_block_for_id:
                 seg = ship_block_for_id.group(0)
-                caps = re.search(r"\b\d{5}\s*([A-Z][A-Z .,&'\-]{3,})\b", seg)
+                caps = _RE_ZIP_CUSTOMER_TOKEN.search(seg)
                 if caps:
                     customer_id = caps.group(1).strip()
 
     # Ship To block: capture until the next major header
-    ship_to_block = _find(r"Ship To:\s*([\s\S]*?)(?:\n\s*(?:Release\s*#|Release\s*Date|Approx\.|Please\s+deliver|Shipper:))", t)
+    ship_to_block = _find(_RE_SHIP_TO_BLOCK, t)
     ship_to = {}
     if ship_to_block:
         # Handle side-by-side columns (Ship From / Ship To) extracted by pypdf layout mode
@@ -197,7 +300,7 @@ def parse_release_text(text: str) -> Dict[str, Any]:
         lines = []
         for ln in raw_lines:
             # If line has multiple chunks separated by 5+ spaces, take the rightmost
-            chunks = re.split(r'\s{5,}', ln)
+            chunks = _RE_COLUMN_GAP.split(ln)
             rightmost = chunks[-1].strip() if chunks else ln.strip()
             if rightmost:
                 lines.append(rightmost)
@@ -208,57 +311,51 @@ def parse_release_text(text: str) -> Dict[str, Any]:
             # Remove customer token appended after ZIP (e.g., '45885ST. MARYS')
             cleaned = []
             for ln in lines[1:]:
-                ln = re.sub(r"(\b\d{5})(?:\s*[A-Z][A-Z .,&'\-]{1,})?$", r"\1", ln)
+                ln = _RE_ZIP_TRAILING_TOKEN.sub(r"\1", ln)
                 cleaned.append(ln)
             ship_to["address"] = ", ".join(cleaned)
 
     # Material row
     lot = (
-        _find(r"\b(CRT\s+[A-Za-z0-9-]+)\s+NT\b", t)
-        or _find(r"\b([A-Z]{3}\s*\S+)\s+NODULAR PIG IRON", t)
-        or _find(r"Lot\s*Number\s*\n([\S ]+)", t)
+        _find(_RE_LOT_CRT, t)
+        or _find(_RE_LOT_NODULAR, t)
+        or _find(_RE_LOT_NUMBER, t)
     )
-    desc = "NODULAR PIG IRON" if re.search(r"NODULAR\s+PIG\s+IRON", t, re.I) else None
+    # Keyword flags: a literal check on the upper-cased text skips the regex
+    # entirely when the word is absent; the regex still decides the match
+    t_upper = t.upper()
+    desc = "NODULAR PIG IRON" if "NODULAR" in t_upper and _RE_NODULAR.search(t) else None
     qty = (
-        _find(r"Approx\.?\s*Quantity[\s\S]{0,200}?(\d+\.\d{3})", t)
-        or _find(r"(?mi)^\s*(\d+\.\d{3})\s+CRT\b", t)
-        or _find(r"(\d+\.\d{3})[\s\S]{0,40}?\bNT\b", t)
+        _find(_RE_QTY_APPROX, t)
+        or _find(_RE_QTY_CRT_LINE, t)
+        or _find(_RE_QTY_NT, t)
     )
 
-    # Analysis primary line
-    c = _find(r"\bC\s*(\d+\.\d+)", t)
-    si = _find(r"\bSi\s*(\d+\.\d+)", t)
-    s = _find(r"\bS\s*(\d+\.\d+)", t)
-    p = _find(r"\bP\s*(\d+\.\d+)", t)
-    mn = _find(r"\bMn\s*(\d+\.\d+)", t)
+    # Analysis primary line and microelements: first value per element
+    elements: Dict[str, str] = {}
+    for m in _RE_ELEMENT.finditer(t):
+        if m.group(1):
+            elements.setdefault(m.group(1).upper(), m.group(2))
+        else:
+            elements.setdefault(m.group(3).upper(), m.group(4))
+        if len(elements) == _ELEMENT_COUNT:
+            break
 
-    analysis: Dict[str, float] = {}
-    for k, v in [("C", c), ("Si", si), ("S", s), ("P", p), ("Mn", mn)]:
-        if v is not None:
-            try:
-                analysis[k] = float(v)
-            except ValueError:
-                pass
+    # The element pattern only captures digits, so float() cannot fail
+    analysis: Dict[str, float] = {
+        k: float(elements[key]) for k, key in _ANALYSIS_ELEMENTS if key in elements
+    }
 
-    # Optional microelements (appear in MINSTER)
-    # Pattern matches both "CR 0.004" and "CR .004" formats
-    cr = _find(r"\bCR\s*\.?(\d+(?:\.\d+)?)", t)
-    ti = _find(r"\bTI\s*\.?(\d+(?:\.\d+)?)", t)
-    v = _find(r"\bV\s*\.?(\d+(?:\.\d+)?)", t)
-    extras = {}
-    for k, val in [("Cr", cr), ("Ti", ti), ("V", v)]:
-        if val:
-            try:
-                # Normalize values like "004" to "0.004"
-                if not val.startswith('0.') and '.' not in val:
-                    val = f"0.{val}"
-                extras[k] = float(val)
-            except ValueError:
-                pass
+    # Optional microelements (appear in MINSTER); normalize "004" to "0.004"
+    extras = {
+        k: float(val if '.' in val else f"0.{val}")
+        for k, key in _EXTRA_ELEMENTS
+        if (val := elements.get(key))
+    }
 
     # Warehouse/location and carrier from Ship Via (if it's a known carrier phrase)
-    warehouse_name = _find(r"Warehouse\s*\n\s*([A-Z]{3})", t) or _find(r"\bWarehouse\b[\s\S]*?\b(CRT)\b", t)
-    warehouse_loc = _find(r"\bCINCINNATI\b", t)
+    warehouse_name = _find(_RE_WAREHOUSE_CODE, t) or _find(_RE_WAREHOUSE_CRT, t)
+    warehouse_loc = "CINCINNATI" in t_upper and _RE_CINCINNATI.search(t) is not None
 
     # If we derived ship_to_name earlier from header row, prefer it
     try:
@@ -266,7 +363,7 @@ def parse_release_text(text: str) -> Dict[str, Any]:
             if not ship_to.get('name') or 'Release Date' in ship_to.get('name', ''):
                 ship_to['name'] = ship_to_name
             # Derive a clean address from the lines following the name
-            if ship_to.get('name') and (not ship_to.get('address') or re.search(r"Release\s*Date|^\s*\d{2}/\d{2}/\d{4}|Release\s*#", ship_to.get('address',''), re.I)):
+            if ship_to.get('name') and (not ship_to.get('address') or _RE_ADDRESS_NOISE.search(ship_to.get('address',''))):
                 name_idx = t.lower().find(ship_to['name'].lower())
                 if name_idx != -1:
                     tail = t[name_idx: name_idx + 600]
@@ -274,13 +371,13 @@ def parse_release_text(text: str) -> Dict[str, Any]:
                     lines = [ln.strip() for ln in tail.splitlines()[1:] if ln.strip()]
                     cleaned = []
                     for ln in lines:
-                        if re.search(r"^(Release\s*#|Shipper:|Please\s+deliver|Charlotte,\s*NC|^\d{2}/\d{2}/\d{4})", ln, re.I):
+                        if _RE_ADDRESS_STOP.search(ln):
                             break
                         # Trim trailing uppercase customer token after ZIP (allow spaces)
-                        ln_cleaned = re.sub(r"(\b\d{5})(?:\s*[A-Z][A-Z .,&'\-]{1,})?$", r"\1", ln)
+                        ln_cleaned = _RE_ZIP_TRAILING_TOKEN.sub(r"\1", ln)
                         cleaned.append(ln_cleaned)
                         # Stop after we've captured City, State ZIP (complete address)
-                        if re.search(r"[A-Za-z]+,\s*[A-Z]{2}\s+\d{5}", ln_cleaned):
+                        if _RE_CITY_COMMA_STATE_ZIP.search(ln_cleaned):
                             break
                     if cleaned:
                         ship_to['address'] = ", ".join(cleaned)
@@ -289,7 +386,7 @@ def parse_release_text(text: str) -> Dict[str, Any]:
                 return isinstance(val, str) and val.strip().upper() in {"SHIP TO", "CUSTOMER ID", "N/A"}
             if (not customer_id or _is_placeholder(customer_id)) and ship_to.get('name'):
                 window = t[name_idx: name_idx + 300] if name_idx != -1 else t
-                m = re.search(r"\b\d{5}\s*([A-Z][A-Z .,&'\-]{2,})", window)
+                m = _RE_ZIP_CUSTOMER_TOKEN_SHORT.search(window)
                 if m:
                     customer_id = m.group(1).strip()
     except Exception:
@@ -297,13 +394,10 @@ def parse_release_text(text: str) -> Dict[str, Any]:
 
     # Schedule lines (e.g., "Deliver 11-05-25 Load #1", "Pickup 01/22/26 Load #1", or "1 TL 11/04/25 LOAD #1")
     sched: List[Dict[str, str]] = []
-    # Pattern handles both dash (11-05-25) and slash (11/04/25) formats
-    DATE_SHORT = r"\d{2}[-/]\d{2}[-/]\d{2}"
-    # Make "Deliver/Pickup" optional to handle formats like "1 TL 11/04/25 LOAD #1"
-    for m in re.finditer(r"(?:\d+\s*TL\s*)?(?:(?:Deliver|Pickup)\s*)?(%s)\s*(?:LOAD|Load)\s*#?\s*(\d+)" % DATE_SHORT, t, re.I):
+    for m in _RE_SCHEDULE.finditer(t):
         ds, num = m.group(1), m.group(2)
         # Convert YY to YYYY (assume 20YY), handle both - and / separators
-        parts = re.split(r'[-/]', ds)
+        parts = _RE_DATE_SEP.split(ds)
         if len(parts) == 3:
             mm, dd, yy = parts
             date_iso = f"20{yy}-{mm}-{dd}"
@@ -318,11 +412,7 @@ def parse_release_text(text: str) -> Dict[str, Any]:
     warehouse_section = None
     try:
         # Match entire Warehouse:/Warehouse requirements: section until next major section or end
-        sec = re.search(
-            r"Warehouse\s*(?:requirements)?\s*:\s*([\s\S]*?)(?=\n\s*(?:Trucking\s*(?:requirements)?\s*:|SPECIAL\s+INSTRUCTIONS\s*:|Ship\s+From\s*:)|$)",
-            t,
-            re.I
-        )
+        sec = _RE_WAREHOUSE_SECTION.search(t)
         if sec:
             warehouse_section = sec.group(1).strip()
     except Exception:
@@ -331,7 +421,7 @@ def parse_release_text(text: str) -> Dict[str, Any]:
     # Warehouse requirements bullets (prefer exact section parsing)
     bol_requirements: List[str] = []
     try:
-        sec = re.search(r"Warehouse\s+requirements\s*:\s*([\s\S]*?)(?:\n\s*(Trucking\s+requirements|Please\s+deliver|$))", t, re.I)
+        sec = _RE_WAREHOUSE_REQUIREMENTS.search(t)
         if sec:
             block = sec.group(1)
             lines = [ln.rstrip() for ln in block.splitlines()]
@@ -352,9 +442,9 @@ def parse_release_text(text: str) -> Dict[str, Any]:
         # Normalize common variants
         normed = []
         for s in bol_requirements:
-            s = re.sub(r"\s+", " ", s).strip()
+            s = _RE_WHITESPACE.sub(" ", s).strip()
             # Fix split sentence for certification line
-            m = re.search(r"Put this statement on BOL:.*free of radioactive contamination", s, re.I)
+            m = _RE_RADIOACTIVE_STATEMENT.search(s)
             if m:
                 s = m.group(0)
             normed.append(s)
@@ -364,20 +454,10 @@ def parse_release_text(text: str) -> Dict[str, Any]:
 
     # Fallback: look for phrases if section parsing failed
     if not bol_requirements:
-        for phrase in [
-            r"Put this statement on BOL:.*free of radioactive contamination",
-            r"free of radioactive contamination",
-            r"Analysis\s*&\s*PO must be on BOL",
-            r"SEND TO THE FOUNDRY",
-            r"Do\s*NOT\s*exceed\s*max(imum)?\s*legal",
-            r"Trucks?\s+must\s+be\s+TARPED",
-            r"Material\s*#\s*\S+",
-            r"P\.O\.\s*#\s*\S+",
-            r"SHIPPER:\s*Primetrade,?\s*LLC",
-        ]:
-            m = re.search(phrase, t, re.I | re.S)
+        for phrase in _RE_BOL_REQUIREMENT_PHRASES:
+            m = phrase.search(t)
             if m:
-                bol_requirements.append(re.sub(r"\s+", " ", m.group(0)).strip())
+                bol_requirements.append(_RE_WHITESPACE.sub(" ", m.group(0)).strip())
 
     # Enhance ship_to with parsed components (using module-level function)
     if ship_to and ship_to.get('address'):
@@ -586,6 +666,47 @@ Instructions:
         return None
 
 
+# Extracted text of recent uploads keyed by SHA-256 of the PDF bytes; only
+# the text is kept, never the upload itself. Oldest entries are evicted first.
+_PDF_TEXT_CACHE: Dict[str, str] = {}
+_PDF_TEXT_CACHE_SIZE = 16
+_PDF_TEXT_CACHE_LOCK = threading.Lock()
+
+
+def _extract_pdf_text(content: bytes, digest: str) -> str:
+    """Extract text from PDF bytes, cached on their digest for re-parsed uploads.
+
+    pypdf extraction dominates parse time, and the same release is often
+    parsed more than once (retries, preview then approve).
+    """
+    text = _PDF_TEXT_CACHE.get(digest)
+    if text is None:
+        text = _read_pdf_text(content)
+        with _PDF_TEXT_CACHE_LOCK:
+            while len(_PDF_TEXT_CACHE) >= _PDF_TEXT_CACHE_SIZE:
+                del _PDF_TEXT_CACHE[next(iter(_PDF_TEXT_CACHE))]
+            _PDF_TEXT_CACHE[digest] = text
+    return text
+
+
+def _read_pdf_text(content: bytes) -> str:
+    """Extract text with pypdf, preferring layout mode unless plain finds far more."""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    reader = PdfReader(BytesIO(content))
+    # Try layout mode first (preserves table structure), fall back to plain if it fails
+    text_layout = "\n".join(page.extract_text(extraction_mode="layout") or "" for page in reader.pages)
+    text_plain = "\n".join(page.extract_text() or "" for page in reader.pages)
+
+    # Use whichever extraction mode got more text
+    if len(text_plain) > len(text_layout) * 2:  # Plain got significantly more text
+        logger.info(f"PDF text: using plain mode ({len(text_plain)} chars vs layout {len(text_layout)} chars)")
+        return text_plain
+    logger.info(f"PDF text: using layout mode ({len(text_layout)} chars vs plain {len(text_plain)} chars)")
+    return text_layout
+
+
 def parse_release_pdf(file_obj, ai_mode: str | None = None) -> Dict[str, Any]:
     """Extract text from a PDF file-like and parse it.
 
@@ -597,27 +718,15 @@ def parse_release_pdf(file_obj, ai_mode: str | None = None) -> Dict[str, Any]:
     If text extraction fails (<100 chars), falls back to Claude Vision (sends PDF directly).
     """
     import logging
-    import hashlib
     logger = logging.getLogger(__name__)
 
-    # Read file to get hash for debugging
+    # Hash the upload for debugging and as the text cache key
     content = file_obj.read()
-    file_hash = hashlib.md5(content).hexdigest()[:8]
-    logger.info(f"PDF upload: {len(content)} bytes, hash={file_hash}")
-    file_obj.seek(0)  # Reset for PdfReader
-
-    reader = PdfReader(file_obj)
-    # Try layout mode first (preserves table structure), fall back to plain if it fails
-    text_layout = "\n".join(page.extract_text(extraction_mode="layout") or "" for page in reader.pages)
-    text_plain = "\n".join(page.extract_text() or "" for page in reader.pages)
+    digest = hashlib.sha256(content).hexdigest()
+    logger.info(f"PDF upload: {len(content)} bytes, hash={digest[:8]}")
+    file_obj.seek(0)  # Leave the upload rewound for callers
 
-    # Use whichever extraction mode got more text
-    if len(text_plain) > len(text_layout) * 2:  # Plain got significantly more text
-        text = text_plain
-        logger.info(f"PDF text: using plain mode ({len(text_plain)} chars vs layout {len(text_layout)} chars)")
-    else:
-        text = text_layout
-        logger.info(f"PDF text: using layout mode ({len(text_layout)} chars vs plain {len(text_plain)} chars)")
+    text = _extract_pdf_text(content, digest)
 
     # FALLBACK: If text extraction failed, use Claude Vision to read PDF directly
     if len(text.strip()) < 100 and ai_mode in ("local", "cloud"):
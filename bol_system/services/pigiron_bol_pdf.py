@@ -11,21 +11,23 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def generate_pigiron_bol_pdf(bol):
+def generate_pigiron_bol_pdf(bol, stream=None):
     """
     Generate pig iron BOL PDF using WeasyPrint.
 
     Args:
         bol: BOL model instance
+        stream: Optional writable file object that receives the PDF
+            directly instead of it being returned as bytes
 
     Returns:
-        bytes: PDF content
+        bytes: PDF content, or ``stream`` when one is given
     """
     try:
         from weasyprint import HTML
     except ImportError:
         logger.warning("WeasyPrint not installed, falling back to ReportLab")
-        return _generate_pdf_reportlab(bol)
+        return _generate_pdf_reportlab(bol, stream)
 
     context = {
         'bol': bol,
@@ -33,25 +35,18 @@ def generate_pigiron_bol_pdf(bol):
 
     html_string = render_to_string('bol/pigiron_bol.html', context)
     html = HTML(string=html_string)
-    pdf_bytes = html.write_pdf()
+    if stream is not None:
+        html.write_pdf(stream)
+        return stream
 
-    return pdf_bytes
+    return html.write_pdf()
 
 
-def _generate_pdf_reportlab(bol):
+def _generate_pdf_reportlab(bol, stream=None):
     """Fallback PDF generation using existing ReportLab generator."""
     from ..pdf_generator import generate_bol_pdf
-    import tempfile
-    import os
 
-    # Generate to temp file and read bytes
-    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-        tmp_path = tmp.name
-
-    try:
-        generate_bol_pdf(bol, output_path=tmp_path)
-        with open(tmp_path, 'rb') as f:
-            return f.read()
-    finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+    # Rendered in memory; no temp file round trip
+    if stream is not None:
+        return generate_bol_pdf(bol, output_path=stream)
+    return generate_bol_pdf(bol, return_bytes=True)
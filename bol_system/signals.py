@@ -0,0 +1,58 @@
+"""
+Signal handlers for bol_system.
+
+Connected in BolSystemConfig.ready().
+"""
+from django.db.models import F
+
+from .models import STATUS_NOT_LOADED, Release, _active_tenant, _company_branding, _role_landing_page
+
+
+def clear_branding_cache(sender, **kwargs):
+    """Drop the cached CompanyBranding instance after it is deleted."""
+    _company_branding.cache_clear()
+
+
+def clear_role_redirect_cache(sender, **kwargs):
+    """Drop cached role landing pages after a RoleRedirectConfig changes."""
+    _role_landing_page.cache_clear()
+
+
+def clear_tenant_cache(sender, **kwargs):
+    """Drop cached tenant lookups after a Tenant changes."""
+    _active_tenant.cache_clear()
+
+
+def _bump_load_counters(release_id, total_delta, shipped_delta):
+    if total_delta or shipped_delta:
+        Release.objects.filter(pk=release_id).update(
+            total_loads_cached=F('total_loads_cached') + total_delta,
+            loads_shipped_cached=F('loads_shipped_cached') + shipped_delta,
+        )
+
+
+def update_release_counters_on_load_save(sender, instance, created, raw=False, **kwargs):
+    """Keep Release.total_loads_cached/loads_shipped_cached in step with a saved load."""
+    if raw:
+        return
+    is_shipped = instance.status == 'SHIPPED'
+    if created:
+        _bump_load_counters(instance.release_id, 1, int(is_shipped))
+    elif getattr(instance, '_loaded_status', STATUS_NOT_LOADED) is STATUS_NOT_LOADED:
+        # Previous status unknown (not loaded from the DB, or status deferred): recount
+        Release.refresh_load_counters([instance.release_id])
+    else:
+        was_shipped = instance._loaded_status == 'SHIPPED'
+        _bump_load_counters(instance.release_id, 0, int(is_shipped) - int(was_shipped))
+    instance._loaded_status = instance.status
+
+
+def update_release_counters_on_load_delete(sender, instance, **kwargs):
+    """Decrement Release load counters when a load is deleted."""
+    loaded_status = getattr(instance, '_loaded_status', None)
+    if loaded_status is STATUS_NOT_LOADED:
+        # Status was deferred and the row is gone, so it can't be read back
+        Release.refresh_load_counters([instance.release_id])
+        return
+    was_shipped = (loaded_status or instance.status) == 'SHIPPED'
+    _bump_load_counters(instance.release_id, -1, -int(was_shipped))
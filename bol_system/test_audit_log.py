@@ -0,0 +1,38 @@
+"""
+Tests for the buffered AuditLog writer.
+
+on_commit callbacks never fire inside a test transaction, so these tests
+put entries on the queue directly and call flush_queue() themselves.
+"""
+
+import pytest
+from unittest.mock import patch
+from django.db import DatabaseError
+from bol_system import models
+from bol_system.models import AuditLog
+
+
+def _queue_entries(*actions):
+    for action in actions:
+        models._audit_queue.put_nowait(
+            AuditLog(action=action, object_type='BOL', object_id='1', user_email='office@primetrade.com')
+        )
+
+
+@pytest.mark.django_db
+def test_flush_queue_writes_buffered_entries():
+    _queue_entries('BOL_VOIDED', 'OFFICIAL_WEIGHT_SET')
+
+    assert AuditLog.flush_queue() == 2
+    assert set(AuditLog.objects.values_list('action', flat=True)) == {'BOL_VOIDED', 'OFFICIAL_WEIGHT_SET'}
+    assert models._audit_queue.empty()
+
+
+@pytest.mark.django_db
+def test_flush_queue_saves_rows_individually_when_bulk_insert_fails():
+    _queue_entries('BOL_VOIDED', 'OFFICIAL_WEIGHT_SET')
+
+    with patch.object(AuditLog.objects, 'bulk_create', side_effect=DatabaseError('connection lost')):
+        assert AuditLog.flush_queue() == 2
+
+    assert AuditLog.objects.count() == 2
@@ -341,3 +341,99 @@ class TestLoadDetailAPI:
         assert release_data['customer_id_text'] == 'Test Steel Corp'
         assert 'customer_ref_id' in release_data
         assert 'ship_to_street' in release_data
+
+
+@pytest.mark.django_db
+class TestReleaseLoadCounters:
+    """Test the denormalized load counters on Release."""
+
+    def test_counters_follow_load_lifecycle(
+        self, test_product, test_customer, test_carrier, test_truck, test_release
+    ):
+        """Counters track load creation, shipping, BOL deletion and load deletion."""
+        test_release.refresh_from_db()
+        assert test_release.total_loads == 3
+        assert test_release.loads_shipped == 0
+
+        load2 = test_release.loads.get(seq=2)
+        bol = BOL.objects.create(
+            product=test_product,
+            product_name=test_product.name,
+            date='2025-11-03',
+            buyer_name='Test Buyer',
+            ship_to='456 Steel Ave, Cincinnati, OH 45202',
+            carrier=test_carrier,
+            carrier_name=test_carrier.carrier_name,
+            truck=test_truck,
+            truck_number=test_truck.truck_number,
+            trailer_number=test_truck.trailer_number,
+            net_tons=Decimal('25.75'),
+            customer=test_customer
+        )
+        load2.status = 'SHIPPED'
+        load2.bol = bol
+        load2.save()
+
+        # A full save of a stale instance must not clobber the counters
+        test_release.save()
+        test_release.refresh_from_db()
+        assert test_release.loads_shipped == 1
+        assert test_release.loads_remaining == 2
+
+        bol.delete()
+        test_release.refresh_from_db()
+        assert test_release.loads_shipped == 0
+
+        test_release.loads.get(seq=3).delete()
+        test_release.refresh_from_db()
+        assert test_release.total_loads == 2
+
+    def test_saving_load_with_deferred_status_recounts(self, test_release):
+        """Saving a shipped load fetched without its status must not count it twice."""
+        ReleaseLoad.objects.filter(release=test_release, seq=1).update(status='SHIPPED')
+        Release.refresh_load_counters([test_release.pk])
+
+        load = ReleaseLoad.objects.only('id', 'date', 'release').get(release=test_release, seq=1)
+        load.save()
+
+        test_release.refresh_from_db()
+        assert test_release.loads_shipped == 1
+
+        load.delete()
+        test_release.refresh_from_db()
+        assert test_release.total_loads == 2
+        assert test_release.loads_shipped == 0
+
+    def test_create_for_release_bulk_creates_loads(self, test_customer):
+        """create_for_release inserts seq 1..N and recounts the release counters."""
+        release = Release.objects.create(
+            release_number='REL-TEST-BULK',
+            customer_id_text='Test Steel Corp',
+            customer_ref=test_customer,
+            status='OPEN'
+        )
+
+        loads = ReleaseLoad.create_for_release(
+            release, 3, planned_tons=Decimal('20.000'), dates=['2025-11-03']
+        )
+
+        assert len(loads) == 3
+        assert list(release.loads.values_list('seq', flat=True)) == [1, 2, 3]
+        assert str(release.loads.get(seq=1).date) == '2025-11-03'
+        assert release.loads.get(seq=2).date is None
+        assert release.total_loads == 3
+        assert release.loads_remaining == 3
+
+    def test_create_for_release_keeps_explicit_seqs(self, test_customer):
+        """Schedule load numbers are kept; rows without one use their position."""
+        release = Release.objects.create(
+            release_number='REL-TEST-SEQS',
+            customer_id_text='Test Steel Corp',
+            customer_ref=test_customer,
+            status='OPEN'
+        )
+
+        ReleaseLoad.create_for_release(release, 3, seqs=[3, None, 5])
+
+        assert sorted(release.loads.values_list('seq', flat=True)) == [2, 3, 5]
+        assert release.total_loads == 3
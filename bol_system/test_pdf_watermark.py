@@ -2,11 +2,13 @@
 Tests for PDF watermarking functionality
 """
 import pytest
+from io import StringIO
 from decimal import Decimal
 from django.test import TestCase
 from django.core.files.storage import default_storage
+from django.core.management import call_command
 from bol_system.models import BOL, Product, Customer, Carrier, Truck
-from bol_system.pdf_generator import generate_bol_pdf
+from bol_system.pdf_generator import generate_bol_pdf, _storage_key
 from bol_system.pdf_watermark import watermark_bol_pdf
 
 
@@ -193,3 +195,73 @@ class PDFWatermarkTestCase(TestCase):
 
         self.assertTrue(default_storage.exists(original_key),
                        "Original PDF should still exist")
+
+    def test_unchanged_bol_reuses_stored_pdf(self):
+        """Regenerating a BOL with identical content should return the stored PDF"""
+        bol_data = {
+            'bolNumber': 'TEST-003',
+            'carrierName': 'Test Carrier',
+            'truckNumber': 'TEST-789',
+            'buyerName': 'Test Buyer 3',
+            'shipTo': '789 Ship Rd',
+            'productName': 'Test Steel',
+            'netTons': 20.00,
+            'date': '2025-01-17',
+        }
+
+        first_url = generate_bol_pdf(bol_data)
+        second_url = generate_bol_pdf(bol_data)
+        changed_url = generate_bol_pdf({**bol_data, 'netTons': 21.00})
+
+        self.assertEqual(first_url, second_url)
+        self.assertNotEqual(first_url, changed_url)
+
+    def test_forced_regeneration_replaces_stored_pdf(self):
+        """force=True should re-render over the stored PDF instead of reusing it"""
+        bol_data = {
+            'bolNumber': 'TEST-004',
+            'carrierName': 'Test Carrier',
+            'truckNumber': 'TEST-321',
+            'buyerName': 'Test Buyer 4',
+            'shipTo': '321 Ship Rd',
+            'productName': 'Test Steel',
+            'netTons': 22.00,
+            'date': '2025-01-18',
+        }
+
+        first_url = generate_bol_pdf(bol_data)
+        storage_name = 'bols/2025/' + first_url.split('bols/2025/')[-1].split('?')[0]
+        with default_storage.open(storage_name, 'wb') as f:
+            f.write(b'corrupted')
+
+        forced_url = generate_bol_pdf(bol_data, force=True)
+
+        self.assertEqual(first_url, forced_url)
+        with default_storage.open(storage_name, 'rb') as f:
+            self.assertTrue(f.read().startswith(b'%PDF'))
+
+    def test_regenerate_command_updates_key_and_prunes_old_render(self):
+        """regenerate_bol_pdf should point pdf_key at the new render and delete the old one"""
+        bol = BOL.objects.create(
+            product=self.product,
+            customer=self.customer,
+            buyer_name='Test Buyer',
+            ship_to='123 Ship St\nShip City, OH 45202',
+            carrier=self.carrier,
+            truck=self.truck,
+            truck_number='TEST-123',
+            trailer_number='TRAILER-456',
+            date='2025-01-15',
+            net_tons=Decimal('25.50')
+        )
+        old_url = generate_bol_pdf(bol)
+        BOL.objects.filter(pk=bol.pk).update(pdf_url=old_url, net_tons=Decimal('26.00'))
+
+        call_command('regenerate_bol_pdf', bol.bol_number, stdout=StringIO())
+
+        bol.refresh_from_db()
+        self.assertNotEqual(bol.pdf_url, old_url)
+        self.assertIn(_storage_key(bol.pdf_url), bol.pdf_key)
+        self.assertFalse(default_storage.exists(_storage_key(old_url)))
+        self.assertTrue(default_storage.exists(_storage_key(bol.pdf_url)))
+        default_storage.delete(_storage_key(bol.pdf_url))
@@ -0,0 +1,107 @@
+"""
+Tests for pigiron view conditional GETs.
+
+bol_detail answers If-None-Match with 304 only while the BOL is unchanged;
+saves that touch its PDF fields must invalidate the ETag. Cached PDF renders
+are keyed on the same updated_at stamp and superseded ones are pruned, and
+renders are warmed on the shared background PDF pool.
+"""
+
+import pytest
+import threading
+from decimal import Decimal
+from io import BytesIO
+from unittest.mock import patch
+from django.core.files.storage import default_storage
+from django.contrib.auth.models import User
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from bol_system import models, pigiron_views
+from bol_system.models import Tenant, Product, Carrier, BOL
+
+
+@pytest.fixture
+def tenant(db):
+    return Tenant.objects.create(name='Pig Iron Tenant', code='PIGTEST')
+
+
+@pytest.fixture
+def test_user(db):
+    return User.objects.create_user(
+        username='pigiron@primetrade.com',
+        email='pigiron@primetrade.com',
+        password='testpass'
+    )
+
+
+@pytest.fixture
+def test_bol(tenant):
+    product = Product.objects.create(tenant=tenant, name='Pig Iron', start_tons=Decimal('100.00'))
+    carrier = Carrier.objects.create(tenant=tenant, carrier_name='Test Carrier')
+    return BOL.objects.create(
+        tenant=tenant,
+        product=product,
+        bol_number='PIGTEST-0001',
+        product_name='Pig Iron',
+        date='2025-01-01',
+        buyer_name='Test Buyer',
+        ship_to='Ship To',
+        carrier=carrier,
+        carrier_name='Test Carrier',
+        net_tons=Decimal('25.00'),
+    )
+
+
+def _get_bol_detail(user, bol, **headers):
+    request = APIRequestFactory().get('/', **headers)
+    force_authenticate(request, user)
+    return pigiron_views.bol_detail(request, bol.tenant.code, bol.id)
+
+
+@pytest.mark.django_db
+def test_bol_detail_etag_returns_304_when_unchanged(test_user, test_bol):
+    response = _get_bol_detail(test_user, test_bol)
+    assert response.status_code == 200
+
+    response = _get_bol_detail(test_user, test_bol, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_bol_detail_etag_changes_when_stamped_pdf_saved(test_user, test_bol):
+    etag = _get_bol_detail(test_user, test_bol)['ETag']
+
+    stamped_url = 'https://example.com/bols/PIGTEST-0001-stamped.pdf'
+    with patch('bol_system.pdf_watermark.watermark_bol_pdf', return_value=stamped_url):
+        test_bol.generate_stamped_pdf()
+
+    response = _get_bol_detail(test_user, test_bol, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data['stamped_pdf_url'] == stamped_url
+
+
+@pytest.mark.django_db
+def test_store_bol_pdf_prunes_superseded_renders(test_bol):
+    old_key = pigiron_views._bol_pdf_cache_key(test_bol)
+    pigiron_views._store_bol_pdf(test_bol, BytesIO(b'%PDF-old'))
+    assert default_storage.exists(old_key)
+
+    test_bol.save()
+    new_key = pigiron_views._bol_pdf_cache_key(test_bol)
+    pigiron_views._store_bol_pdf(test_bol, BytesIO(b'%PDF-new'))
+
+    try:
+        assert new_key != old_key
+        assert default_storage.exists(new_key)
+        assert not default_storage.exists(old_key)
+    finally:
+        default_storage.delete(new_key)
+
+
+@pytest.mark.django_db
+def test_pdf_jobs_run_on_shared_pool_after_commit(django_capture_on_commit_callbacks):
+    ran = threading.Event()
+    with django_capture_on_commit_callbacks(execute=True):
+        models.submit_pdf_job_on_commit(ran.set)
+        assert not ran.is_set()
+    assert ran.wait(5)
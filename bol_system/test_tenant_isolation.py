@@ -405,3 +405,15 @@ class ReleaseNumberTenantIsolationTests(TenantIsolationTestCase):
         ).exclude(status='CANCELLED').first()
 
         self.assertIsNotNone(existing)
+
+
+class ActiveTenantLookupTests(TenantIsolationTestCase):
+    """Test the cached Tenant.get_active_by_code lookup."""
+
+    def test_unknown_code_is_not_cached(self):
+        """A tenant created without signals (e.g. in another worker) is found at once."""
+        self.assertIsNone(Tenant.get_active_by_code('tenant_c'))
+
+        Tenant.objects.bulk_create([Tenant(name='Tenant C', code='TENANT_C')])
+
+        self.assertEqual(Tenant.get_active_by_code('tenant_c').code, 'TENANT_C')
@@ -138,6 +138,30 @@ class TestBOLWeightTracking:
         assert load.status == 'SHIPPED'
         assert load.bol == bol
 
+    def test_for_pdf_computes_total_pounds(
+        self, test_product, test_customer, test_carrier, test_truck
+    ):
+        """BOL.objects.for_pdf annotates net_tons in pounds (2000 lbs/ton)."""
+        bol = BOL.objects.create(
+            product=test_product,
+            product_name=test_product.name,
+            date='2025-11-03',
+            buyer_name='Test Buyer',
+            ship_to='123 Ship St',
+            carrier=test_carrier,
+            carrier_name=test_carrier.carrier_name,
+            truck=test_truck,
+            truck_number=test_truck.truck_number,
+            trailer_number=test_truck.trailer_number,
+            net_tons=Decimal('24.50'),
+            customer=test_customer
+        )
+
+        annotated = BOL.objects.for_pdf().get(pk=bol.pk)
+
+        assert annotated._total_lbs == Decimal('49000.00')
+        assert int(annotated._total_lbs) == bol.total_weight_lbs
+
 
 @pytest.mark.django_db
 class TestBOLDeletionRevertsToPending:
@@ -187,6 +211,40 @@ class TestBOLDeletionRevertsToPending:
         assert load.status == 'PENDING'
         assert load.bol is None
 
+    def test_bulk_delete_reverts_all_loads_to_pending(
+        self, test_user, test_product, test_customer, test_carrier,
+        test_truck, test_release
+    ):
+        """BOL.bulk_delete reverts every linked ReleaseLoad in one pass."""
+        loads = list(test_release.loads.all()[:2])
+        for load in loads:
+            bol = BOL.objects.create(
+                product=test_product,
+                product_name=test_product.name,
+                date='2025-11-03',
+                buyer_name='Test Buyer',
+                ship_to='123 Ship St',
+                carrier=test_carrier,
+                carrier_name=test_carrier.carrier_name,
+                truck=test_truck,
+                truck_number=test_truck.truck_number,
+                trailer_number=test_truck.trailer_number,
+                net_tons=Decimal('24.50'),
+                customer=test_customer
+            )
+            load.status = 'SHIPPED'
+            load.bol = bol
+            load.save()
+
+        deleted = BOL.bulk_delete(BOL.objects.filter(product=test_product))
+
+        assert deleted == 2
+        assert not BOL.objects.filter(product=test_product).exists()
+        for load in loads:
+            load.refresh_from_db()
+            assert load.status == 'PENDING'
+            assert load.bol is None
+
 
 @pytest.mark.django_db
 class TestOpenReleasesUsesOfficialWeight:
@@ -255,6 +313,12 @@ class TestOpenReleasesUsesOfficialWeight:
         assert tons_shipped == 48.25  # 24.50 + 23.75
         assert tons_remaining == 43.75  # 92.0 - 48.25
 
+        # Prefetched path used by the release list views agrees
+        release = Release.objects.with_loads().get(pk=test_release.pk)
+        official, planned = release.shipped_tonnage()
+        assert float(official + planned) == tons_shipped
+        assert len(release.shipped_loads) == 2
+
 
     def test_open_releases_fallback_to_planned_tons(
         self, test_user, test_product, test_customer, test_carrier,
@@ -378,3 +442,35 @@ class TestEdgeCases:
         assert shipped_count == 2
         assert pending_count == 2
         assert tons_shipped == 49.0  # 24.0 + 25.0
+
+
+@pytest.mark.django_db
+class TestProductTonnageAnnotation:
+    """Test that Product.objects.with_tonnage() matches the per-product aggregate."""
+
+    def test_with_tonnage_excludes_voided_bols(
+        self, test_product, test_customer, test_carrier, test_truck
+    ):
+        """Annotated shipped/remaining tons ignore voided BOLs."""
+        for net_tons, is_void in [(Decimal('24.50'), False), (Decimal('10.00'), True)]:
+            BOL.objects.create(
+                product=test_product,
+                product_name=test_product.name,
+                date='2025-11-03',
+                buyer_name='Test Buyer',
+                ship_to='123 Ship St',
+                carrier=test_carrier,
+                carrier_name=test_carrier.carrier_name,
+                truck=test_truck,
+                truck_number=test_truck.truck_number,
+                trailer_number=test_truck.trailer_number,
+                net_tons=net_tons,
+                customer=test_customer,
+                is_void=is_void
+            )
+
+        annotated = Product.objects.with_tonnage().get(id=test_product.id)
+
+        assert annotated.shipped_tons == Decimal('24.50')
+        assert annotated.remaining_tons == Decimal('975.50')
+        assert annotated.shipped_tons == test_product.shipped_tons
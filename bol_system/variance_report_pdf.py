@@ -12,6 +12,56 @@ from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_CENTER
 from datetime import datetime
 
 
+# Styles are identical for every report; build them once per process
+_STYLES = getSampleStyleSheet()
+
+_HEADER_STYLE = ParagraphStyle(
+    'CustomHeader', parent=_STYLES['Heading1'],
+    fontSize=20, textColor=colors.HexColor('#000000'),
+    spaceAfter=0, spaceBefore=0, fontName='Helvetica-Bold'
+)
+
+_SUBHEADER_STYLE = ParagraphStyle(
+    'CustomSubheader', parent=_STYLES['Normal'],
+    fontSize=8, textColor=colors.HexColor('#666666'),
+    spaceAfter=0, spaceBefore=0
+)
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle', parent=_STYLES['Heading1'],
+    fontSize=14, textColor=colors.HexColor('#000000'),
+    spaceAfter=2, spaceBefore=4, fontName='Helvetica-Bold'
+)
+
+_SECTION_STYLE = ParagraphStyle(
+    'SectionTitle', parent=_STYLES['Heading2'],
+    fontSize=10, textColor=colors.HexColor('#000000'),
+    spaceAfter=3, spaceBefore=8, fontName='Helvetica-Bold'
+)
+
+_DATE_RIGHT_STYLE = ParagraphStyle(
+    'DateRight', parent=_STYLES['Normal'],
+    fontSize=9, alignment=TA_RIGHT, textColor=colors.HexColor('#666666'),
+)
+
+_SMALL_STYLE = ParagraphStyle(
+    'SmallText', parent=_STYLES['Normal'],
+    fontSize=8, spaceAfter=0, spaceBefore=0
+)
+
+_NOTE_STYLE = ParagraphStyle(
+    'NoteText', parent=_STYLES['Normal'],
+    fontSize=7, textColor=colors.HexColor('#888888'),
+    spaceAfter=0, spaceBefore=2
+)
+
+_FOOTER_STYLE = ParagraphStyle(
+    'Footer', parent=_STYLES['Normal'],
+    fontSize=7, textColor=colors.HexColor('#888888'),
+    alignment=TA_CENTER, spaceBefore=2
+)
+
+
 def generate_variance_pdf(report_data):
     """
     Generate branded PDF for weight variance report.
@@ -34,38 +84,6 @@ def generate_variance_pdf(report_data):
     )
 
     story = []
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    header_style = ParagraphStyle(
-        'CustomHeader', parent=styles['Heading1'],
-        fontSize=20, textColor=colors.HexColor('#000000'),
-        spaceAfter=0, spaceBefore=0, fontName='Helvetica-Bold'
-    )
-    subheader_style = ParagraphStyle(
-        'CustomSubheader', parent=styles['Normal'],
-        fontSize=8, textColor=colors.HexColor('#666666'),
-        spaceAfter=0, spaceBefore=0
-    )
-    title_style = ParagraphStyle(
-        'CustomTitle', parent=styles['Heading1'],
-        fontSize=14, textColor=colors.HexColor('#000000'),
-        spaceAfter=2, spaceBefore=4, fontName='Helvetica-Bold'
-    )
-    section_style = ParagraphStyle(
-        'SectionTitle', parent=styles['Heading2'],
-        fontSize=10, textColor=colors.HexColor('#000000'),
-        spaceAfter=3, spaceBefore=8, fontName='Helvetica-Bold'
-    )
-    small_style = ParagraphStyle(
-        'SmallText', parent=styles['Normal'],
-        fontSize=8, spaceAfter=0, spaceBefore=0
-    )
-    note_style = ParagraphStyle(
-        'NoteText', parent=styles['Normal'],
-        fontSize=7, textColor=colors.HexColor('#888888'),
-        spaceAfter=0, spaceBefore=2
-    )
 
     product_name = report_data.get('product_name', '')
     summary = report_data.get('summary', {})
@@ -79,11 +97,11 @@ def generate_variance_pdf(report_data):
     # --- Header ---
     header_table_data = [
         [
-            Paragraph("CBRT", header_style),
-            Paragraph("WEIGHT VARIANCE REPORT", title_style)
+            Paragraph("CBRT", _HEADER_STYLE),
+            Paragraph("WEIGHT VARIANCE REPORT", _TITLE_STYLE)
         ],
         [
-            Paragraph("Cincinnati Barge & Rail Terminal, LLC<br/>1707 Riverside Drive, Cincinnati, Ohio 45202", subheader_style),
+            Paragraph("Cincinnati Barge & Rail Terminal, LLC<br/>1707 Riverside Drive, Cincinnati, Ohio 45202", _SUBHEADER_STYLE),
             ''
         ]
     ]
@@ -108,11 +126,8 @@ def generate_variance_pdf(report_data):
     # Product + date info
     generated_str = datetime.now().strftime('%b %d, %Y %I:%M %p')
     info_data = [[
-        Paragraph(f"<b>Product:</b> {product_name}", small_style),
-        Paragraph(f"Generated: {generated_str}", ParagraphStyle(
-            'DateRight', parent=styles['Normal'],
-            fontSize=9, alignment=TA_RIGHT, textColor=colors.HexColor('#666666'),
-        ))
+        Paragraph(f"<b>Product:</b> {product_name}", _SMALL_STYLE),
+        Paragraph(f"Generated: {generated_str}", _DATE_RIGHT_STYLE)
     ]]
     info_table = Table(info_data, colWidths=[5.0 * inch, 2.7 * inch])
     info_table.setStyle(TableStyle([
@@ -125,12 +140,12 @@ def generate_variance_pdf(report_data):
     story.append(Spacer(1, 0.1 * inch))
 
     # --- Executive Summary ---
-    story.append(Paragraph("EXECUTIVE SUMMARY", section_style))
+    story.append(Paragraph("EXECUTIVE SUMMARY", _SECTION_STYLE))
     summary_data = [
-        [_b("Total BOLs", small_style), str(summary.get('total_bols', 0)),
-         _b("With Official", small_style), str(summary.get('with_official', 0))],
-        [_b("Missing Official", small_style), str(summary.get('without_official', 0)),
-         _b("Coverage", small_style), f"{summary.get('coverage_pct', 0)}%"],
+        [_b("Total BOLs", _SMALL_STYLE), str(summary.get('total_bols', 0)),
+         _b("With Official", _SMALL_STYLE), str(summary.get('with_official', 0))],
+        [_b("Missing Official", _SMALL_STYLE), str(summary.get('without_official', 0)),
+         _b("Coverage", _SMALL_STYLE), f"{summary.get('coverage_pct', 0)}%"],
     ]
     t = Table(summary_data, colWidths=[1.5 * inch, 1.0 * inch, 1.5 * inch, 1.0 * inch])
     t.setStyle(_grid_style())
@@ -139,11 +154,11 @@ def generate_variance_pdf(report_data):
 
     # --- Accuracy ---
     if accuracy.get('has_data'):
-        story.append(Paragraph("BUCKET WEIGHT ACCURACY", section_style))
+        story.append(Paragraph("BUCKET WEIGHT ACCURACY", _SECTION_STYLE))
         acc_data = [
-            [_b("Dataset", small_style), _b("Count", small_style), _b("Mean %", small_style),
-             _b("Median %", small_style), _b("Std Dev %", small_style),
-             _b("Heavier", small_style), _b("Lighter", small_style)],
+            [_b("Dataset", _SMALL_STYLE), _b("Count", _SMALL_STYLE), _b("Mean %", _SMALL_STYLE),
+             _b("Median %", _SMALL_STYLE), _b("Std Dev %", _SMALL_STYLE),
+             _b("Heavier", _SMALL_STYLE), _b("Lighter", _SMALL_STYLE)],
         ]
         a = accuracy.get('all', {})
         acc_data.append([
@@ -165,14 +180,14 @@ def generate_variance_pdf(report_data):
         t = Table(acc_data, colWidths=[1.1 * inch, 0.7 * inch, 0.9 * inch, 0.9 * inch, 0.9 * inch, 0.8 * inch, 0.8 * inch])
         t.setStyle(_grid_style())
         story.append(t)
-        story.append(Paragraph("Positive = official heavier than bucket. Negative = official lighter.", note_style))
+        story.append(Paragraph("Positive = official heavier than bucket. Negative = official lighter.", _NOTE_STYLE))
         story.append(Spacer(1, 0.1 * inch))
 
     # --- Inventory Comparison ---
-    story.append(Paragraph("INVENTORY COMPARISON", section_style))
+    story.append(Paragraph("INVENTORY COMPARISON", _SECTION_STYLE))
     inv_data = [
-        [_b("Scenario", small_style), _b("Shipped", small_style),
-         _b("Remaining", small_style), _b("Method", small_style)],
+        [_b("Scenario", _SMALL_STYLE), _b("Shipped", _SMALL_STYLE),
+         _b("Remaining", _SMALL_STYLE), _b("Method", _SMALL_STYLE)],
         ["Bucket Only", _fmt(inventory.get('bucket_shipped')), _fmt(inventory.get('bucket_remaining')), "sum(net_tons)"],
         ["Hybrid", _fmt(inventory.get('hybrid_shipped')), _fmt(inventory.get('hybrid_remaining')), "official ?? bucket"],
         ["Best Estimate", _fmt(inventory.get('best_shipped')), _fmt(inventory.get('best_remaining')),
@@ -181,16 +196,16 @@ def generate_variance_pdf(report_data):
     t = Table(inv_data, colWidths=[1.5 * inch, 1.3 * inch, 1.3 * inch, 3.6 * inch])
     t.setStyle(_grid_style())
     story.append(t)
-    story.append(Paragraph(f"Starting inventory: {_fmt(inventory.get('start_tons'))} tons", note_style))
+    story.append(Paragraph(f"Starting inventory: {_fmt(inventory.get('start_tons'))} tons", _NOTE_STYLE))
     story.append(Spacer(1, 0.1 * inch))
 
     # --- Carrier Variance ---
     if carriers:
         elements = []
-        elements.append(Paragraph("CARRIER VARIANCE", section_style))
+        elements.append(Paragraph("CARRIER VARIANCE", _SECTION_STYLE))
         car_data = [
-            [_b("Carrier", small_style), _b("BOLs", small_style), _b("Avg %", small_style),
-             _b("Min %", small_style), _b("Max %", small_style)],
+            [_b("Carrier", _SMALL_STYLE), _b("BOLs", _SMALL_STYLE), _b("Avg %", _SMALL_STYLE),
+             _b("Min %", _SMALL_STYLE), _b("Max %", _SMALL_STYLE)],
         ]
         for c in carriers:
             car_data.append([
@@ -206,9 +221,9 @@ def generate_variance_pdf(report_data):
     # --- Buyer Summary ---
     if buyers:
         elements = []
-        elements.append(Paragraph("BUYER SUMMARY", section_style))
+        elements.append(Paragraph("BUYER SUMMARY", _SECTION_STYLE))
         buy_data = [
-            [_b("Buyer", small_style), _b("BOLs", small_style), _b("Total Net Tons", small_style)],
+            [_b("Buyer", _SMALL_STYLE), _b("BOLs", _SMALL_STYLE), _b("Total Net Tons", _SMALL_STYLE)],
         ]
         for b in buyers:
             buy_data.append([b['buyer_name'], str(b['bol_count']), _fmt(b['total_net_tons'])])
@@ -220,10 +235,10 @@ def generate_variance_pdf(report_data):
 
     # --- Outliers ---
     if outliers:
-        story.append(Paragraph("FLAGGED OUTLIERS (>5% VARIANCE)", section_style))
+        story.append(Paragraph("FLAGGED OUTLIERS (>5% VARIANCE)", _SECTION_STYLE))
         out_data = [
-            [_b("BOL #", small_style), _b("Date", small_style), _b("Bucket", small_style),
-             _b("Official", small_style), _b("Var %", small_style), _b("Cause", small_style)],
+            [_b("BOL #", _SMALL_STYLE), _b("Date", _SMALL_STYLE), _b("Bucket", _SMALL_STYLE),
+             _b("Official", _SMALL_STYLE), _b("Var %", _SMALL_STYLE), _b("Cause", _SMALL_STYLE)],
         ]
         for o in outliers[:20]:  # Cap at 20 for PDF
             out_data.append([
@@ -235,15 +250,15 @@ def generate_variance_pdf(report_data):
         t.setStyle(_grid_style())
         story.append(t)
         if len(outliers) > 20:
-            story.append(Paragraph(f"Showing 20 of {len(outliers)} outliers. See HTML report for full list.", note_style))
+            story.append(Paragraph(f"Showing 20 of {len(outliers)} outliers. See HTML report for full list.", _NOTE_STYLE))
         story.append(Spacer(1, 0.1 * inch))
 
     # --- Missing ---
     if missing:
-        story.append(Paragraph(f"MISSING OFFICIAL WEIGHTS ({len(missing)})", section_style))
+        story.append(Paragraph(f"MISSING OFFICIAL WEIGHTS ({len(missing)})", _SECTION_STYLE))
         mis_data = [
-            [_b("BOL #", small_style), _b("Date", small_style), _b("Buyer", small_style),
-             _b("Carrier", small_style), _b("Bucket (tons)", small_style)],
+            [_b("BOL #", _SMALL_STYLE), _b("Date", _SMALL_STYLE), _b("Buyer", _SMALL_STYLE),
+             _b("Carrier", _SMALL_STYLE), _b("Bucket (tons)", _SMALL_STYLE)],
         ]
         for m in missing[:30]:  # Cap at 30 for PDF
             mis_data.append([
@@ -255,19 +270,14 @@ def generate_variance_pdf(report_data):
         t.setStyle(_grid_style())
         story.append(t)
         if len(missing) > 30:
-            story.append(Paragraph(f"Showing 30 of {len(missing)}. See HTML report for full list.", note_style))
+            story.append(Paragraph(f"Showing 30 of {len(missing)}. See HTML report for full list.", _NOTE_STYLE))
 
     # --- Footer ---
     story.append(Spacer(1, 0.15 * inch))
     story.append(line_table)
-    footer_style = ParagraphStyle(
-        'Footer', parent=styles['Normal'],
-        fontSize=7, textColor=colors.HexColor('#888888'),
-        alignment=TA_CENTER, spaceBefore=2
-    )
     story.append(Paragraph(
         "Weight Variance Report — Cincinnati Barge & Rail Terminal, LLC. Contact CBRT for questions.",
-        footer_style
+        _FOOTER_STYLE
     ))
 
     doc.build(story)
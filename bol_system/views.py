@@ -8,7 +8,7 @@ from django.db.models.functions import Coalesce
 from django.core.files.storage import default_storage
 from .models import Product, Customer, Carrier, Truck, BOL, Release, ReleaseLoad, CustomerShipTo, Lot, AuditLog, Tenant
 from .serializers import ProductSerializer, CustomerSerializer, CarrierSerializer, TruckSerializer, ReleaseSerializer, ReleaseLoadSerializer, CustomerShipToSerializer, AuditLogSerializer
-from .pdf_generator import generate_bol_pdf
+from .pdf_generator import delete_superseded_pdf, generate_bol_pdf
 from .release_parser import parse_release_pdf
 from .email_utils import send_bol_notification
 from .security import validate_tenant_access, get_tenant_filter
@@ -21,7 +21,6 @@ from django.utils import timezone
 import logging
 import os
 import base64
-import tempfile
 from decimal import Decimal
 import re
 import json
@@ -53,7 +52,7 @@ def audit(request, action: str, obj=None, message: str = '', extra: dict | None
     try:
         from .models import AuditLog  # local import to avoid circular during migrations
         tenant = getattr(request, 'tenant', None)
-        entry = AuditLog.objects.create(
+        entry = AuditLog.enqueue(
             tenant=tenant,
             action=action,
             object_type=(obj.__class__.__name__ if obj is not None else ''),
@@ -702,33 +701,16 @@ def preview_bol(request):
             'release_line': release_load,  # For chemistry override support in PDF generator
         }
 
-        # Generate temporary PDF
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-        temp_path = temp_file.name
-        temp_file.close()
+        # Render in memory; the preview is never stored
+        pdf_bytes = generate_bol_pdf(preview_data, return_bytes=True)
+        pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
 
-        try:
-            generate_bol_pdf(preview_data, output_path=temp_path)
-
-            # Read PDF and encode as base64
-            with open(temp_path, 'rb') as pdf_file:
-                pdf_bytes = pdf_file.read()
-                pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
-
-            logger.info(f"BOL preview generated by {request.user.username}")
-
-            return Response({
-                'ok': True,
-                'pdfBase64': pdf_base64
-            })
+        logger.info(f"BOL preview generated by {request.user.username}")
 
-        finally:
-            # Cleanup temp file
-            if os.path.exists(temp_path):
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass  # Ignore cleanup errors
+        return Response({
+            'ok': True,
+            'pdfBase64': pdf_base64
+        })
 
     except ValueError as e:
         logger.error(f"Validation error in preview_bol: {str(e)}")
@@ -1309,15 +1291,14 @@ def approve_release(request):
                     per_load = float(data['quantityNetTons'])/max(len(sched),1)
             except Exception:
                 per_load = None
-            for i, row in enumerate(sched, start=1):
-                load = ReleaseLoad.objects.create(
-                    release=rel,
-                    seq=i,
-                    date=_parse_date_any(row.get('date') if isinstance(row, dict) else None),
-                    planned_tons=per_load,
-                    updated_by=request.user.username,
-                )
-                logger.info(f"Created load {i} for release {rel.release_number}: {load.id}")
+            loads = ReleaseLoad.create_for_release(
+                rel,
+                len(sched),
+                planned_tons=per_load,
+                dates=[_parse_date_any(row.get('date') if isinstance(row, dict) else None) for row in sched],
+                updated_by=request.user.username,
+            )
+            logger.info(f"Created {len(loads)} loads for release {rel.release_number}")
 
         normalized_ids = {
             'customerId': rel.customer_ref.id if rel.customer_ref else None,
@@ -1347,29 +1328,23 @@ def list_releases(request):
         # Filter by tenant for data isolation
         tenant_filter = get_tenant_filter(request)
         if status_filter == 'ALL':
-            rels = Release.objects.filter(**tenant_filter).order_by('-created_at')
+            rels = Release.objects.list_columns().with_loads().filter(**tenant_filter).order_by('-created_at')
         else:
-            rels = Release.objects.filter(status=status_filter, **tenant_filter).order_by('-created_at')
+            rels = Release.objects.list_columns().with_loads().filter(status=status_filter, **tenant_filter).order_by('-created_at')
         result = []
         for r in rels:
-            loads_total = r.loads.count()
-            shipped = r.loads.filter(status='SHIPPED').count()
+            loads_total = r.total_loads
+            shipped = r.loads_shipped
             remaining = loads_total - shipped
             tons_total = float(r.quantity_net_tons or 0)
 
             # Calculate weight breakdown: official vs planned
-            shipped_loads = r.loads.filter(status='SHIPPED')
-            tons_official = float(shipped_loads.filter(bol__official_weight_tons__isnull=False).aggregate(
-                sum=models.Sum('bol__official_weight_tons')
-            )['sum'] or 0)
-            tons_planned = float(shipped_loads.filter(bol__official_weight_tons__isnull=True).aggregate(
-                sum=models.Sum('planned_tons')
-            )['sum'] or 0)
+            tons_official, tons_planned = (float(t) for t in r.shipped_tonnage())
             tons_shipped = tons_official + tons_planned
             tons_remaining = max(0.0, tons_total - tons_shipped)
 
-            next_date = r.loads.filter(status='PENDING').order_by('date').values_list('date', flat=True).first()
-            last_shipped = r.loads.filter(status='SHIPPED').order_by('-date').values_list('date', flat=True).first()
+            next_date = r.pending_loads[0].date if r.pending_loads else None
+            last_shipped = r.shipped_loads[0].date if r.shipped_loads else None
 
             # Urgency calculations
             days_until_next = None
@@ -2076,7 +2051,7 @@ def set_official_weight(request, bol_id):
 
         # Set official weight using model method (handles variance calculation)
         entered_by = request.user.email or request.user.username
-        bol.set_official_weight(weight_tons, entered_by)
+        bol.set_official_weight(weight_tons, entered_by, stamp_async=True)
 
         # Audit log
         audit(request, 'OFFICIAL_WEIGHT_SET', bol,
@@ -2104,7 +2079,8 @@ def set_official_weight(request, bol_id):
             'enteredBy': bol.official_weight_entered_by,
             'enteredAt': bol.official_weight_entered_at.isoformat() if bol.official_weight_entered_at else None,
             'pdfUrl': pdf_url,
-            'stampedPdfUrl': stamped_pdf_url
+            'stampedPdfUrl': stamped_pdf_url,
+            'stampedPdfStatus': 'ready' if stamped_pdf_url else 'pending',
         })
 
     except BOL.DoesNotExist:
@@ -2126,14 +2102,16 @@ def regenerate_bol_pdf(request, bol_id):
     Useful when BOL data changes after creation or PDF is corrupted.
     """
     try:
-        bol = BOL.objects.get(id=bol_id, **get_tenant_filter(request))
+        bol = BOL.objects.for_pdf().get(id=bol_id, **get_tenant_filter(request))
 
         # Regenerate PDF
         try:
-            pdf_url = generate_bol_pdf(bol)
+            old_url = bol.pdf_url
+            pdf_url = generate_bol_pdf(bol, force=True)
             bol.pdf_url = pdf_url
             bol.pdf_key = _derive_pdf_key(pdf_url)
             bol.save(update_fields=['pdf_url', 'pdf_key', 'updated_at'])
+            delete_superseded_pdf(old_url, pdf_url)
             logger.info(f"Regenerated PDF for BOL {bol.bol_number} at {pdf_url}")
 
             # Audit log
@@ -2314,7 +2292,7 @@ def inventory_report(request):
             period_bols = []
 
             for bol in bols:
-                bol_date = _parse_date_any(bol.date)
+                bol_date = bol.bol_date or _parse_date_any(bol.date)
 
                 # Use CBRT scale weight (net_tons) per client request
                 try:
@@ -2424,7 +2402,7 @@ def inventory_report_pdf(request):
             period_bols = []
 
             for bol in bols:
-                bol_date = _parse_date_any(bol.date)
+                bol_date = bol.bol_date or _parse_date_any(bol.date)
                 # Use CBRT scale weight (net_tons) per client request
                 try:
                     weight = float(bol.net_tons)
@@ -2775,7 +2753,7 @@ def client_inventory(request):
     Shows all active products with start/shipped/remaining tons.
     Uses same format as /api/balances/ for frontend compatibility.
     """
-    products = Product.objects.filter(is_active=True, **get_tenant_filter(request)).order_by('name')
+    products = Product.objects.with_tonnage().filter(is_active=True, **get_tenant_filter(request)).order_by('name')
 
     # Match /api/balances/ field names for frontend compatibility
     return Response([
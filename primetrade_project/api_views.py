@@ -20,7 +20,6 @@ from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
-from django.db import models
 from primetrade_project.decorators import require_role
 import jwt
 from jwt import PyJWKClient
@@ -268,32 +267,25 @@ def open_releases(request):
     releases = Release.objects.filter(
         status='OPEN',
         created_at__date__gte=cutoff_date
-    ).select_related('customer_ref').prefetch_related('loads').order_by('-created_at')
+    ).select_related('customer_ref').with_loads().order_by('-created_at')
 
     if releases.exists():
         tenant_releases = []
         for release in releases:
             # Calculate load stats
-            loads = release.loads.all()
-            loads_pending = loads.filter(status='PENDING').count()
-            loads_shipped = loads.filter(status='SHIPPED').count()
+            loads_pending = len(release.pending_loads)
+            loads_shipped = len(release.shipped_loads)
 
             # Calculate tonnage
             total_tons = float(release.quantity_net_tons or 0)
 
             # Shipped tons: official weight if available, otherwise planned
-            shipped_loads = loads.filter(status='SHIPPED')
-            tons_official = float(shipped_loads.filter(
-                bol__official_weight_tons__isnull=False
-            ).aggregate(sum=models.Sum('bol__official_weight_tons'))['sum'] or 0)
-            tons_planned = float(shipped_loads.filter(
-                bol__official_weight_tons__isnull=True
-            ).aggregate(sum=models.Sum('planned_tons'))['sum'] or 0)
+            tons_official, tons_planned = (float(t) for t in release.shipped_tonnage())
             tons_shipped = tons_official + tons_planned
             tons_remaining = max(0.0, total_tons - tons_shipped)
 
             # Next scheduled date from pending loads
-            next_load = loads.filter(status='PENDING').order_by('date').first()
+            next_load = release.pending_loads[0] if release.pending_loads else None
             next_scheduled_date = None
             if next_load and next_load.date:
                 next_scheduled_date = (
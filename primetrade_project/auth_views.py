@@ -481,13 +481,10 @@ def sso_callback(request):
     redirect_url = 'home'  # Default fallback
     try:
         from bol_system.models import RoleRedirectConfig
-        config = RoleRedirectConfig.objects.filter(
-            role_name=role,
-            is_active=True
-        ).first()
+        landing_page = RoleRedirectConfig.get_landing_page(role)
 
-        if config:
-            redirect_url = config.landing_page
+        if landing_page:
+            redirect_url = landing_page
             if settings.DEBUG_AUTH_FLOW:
                 logger.debug(f"[FLOW DEBUG 11.6] Using role-based redirect: {redirect_url}")
         else: